@@ -3,7 +3,7 @@ from fastapi import Query
 from fastapi.responses import JSONResponse
 from app.api.ibkr import ibkr_router, ib_interface
 from app.core.setup_logging import logger
-from app.models import AccountSummary, AccountValue, Position
+from app.models import AccountDashboard, AccountSummary, AccountValue, Position
 
 
 @ibkr_router.get(
@@ -117,3 +117,44 @@ async def get_positions_detailed() -> list[Position]:
       status_code=500,
       content={"error": str(e), "message": "Failed to get detailed positions"}
     )
+
+
+@ibkr_router.get(
+  "/account/dashboard",
+  operation_id="get_account_dashboard",
+  response_model=AccountDashboard,
+)
+async def get_account_dashboard() -> AccountDashboard:
+  """Get account summary, detailed positions and connection status.
+
+  Fetches all three concurrently, which is faster than calling the
+  individual endpoints one after another.
+
+  Returns:
+    Dashboard with account summary items, positions and connection status.
+
+  Example:
+    >>> await get_account_dashboard()
+    {
+      "summary": [
+        {"account": "DU123456", "tag": "NetLiquidation", "value": "100000.00",
+         "currency": "USD"}
+      ],
+      "positions": [
+        {"account": "DU123456", "symbol": "AAPL", "position": 100.0, ...}
+      ],
+      "connection": {
+        "connected": true, "host": "localhost", "port": 8888,
+        "client_id": "412", "accounts": ["DU123456"]
+      }
+    }
+  """
+  try:
+    logger.debug("Getting account dashboard")
+    return await ib_interface.get_dashboard()
+  except Exception as e:
+    logger.error(f"Error in get_account_dashboard: {e}")
+    return JSONResponse(
+      status_code=500,
+      content={"error": str(e), "message": "Failed to get account dashboard"}
+    )
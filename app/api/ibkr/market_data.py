@@ -4,7 +4,7 @@ from fastapi import Query
 from fastapi.responses import JSONResponse
 from app.api.ibkr import ibkr_router, ib_interface
 from app.core.setup_logging import logger
-from app.models import TickerData, BarData, TickData
+from app.models import TickerData, BarData, TickData, HistoricalDataRequest
 
 # Module-level query parameter definitions
 CONTRACT_IDS_QUERY = Query(default=None, description="List of contract IDs")
@@ -58,7 +58,7 @@ async def get_tickers(
     logger.error("Error in get_tickers: {!s}", str(e))
     return []
   else:
-    logger.debug("Tickers: {tickers}", tickers=tickers)
+    logger.debug("Got {count} tickers", count=len(tickers))
     return tickers
 
 @ibkr_router.get(
@@ -141,8 +141,8 @@ async def get_and_filter_options_chain(
     return []
   else:
     logger.debug(
-      "Filtered options: {filtered_options}",
-      filtered_options=filtered_options,
+      "Got {count} filtered options",
+      count=len(filtered_options),
     )
     return filtered_options
 
@@ -220,6 +220,46 @@ async def get_historical_data(
     )
 
 
+@ibkr_router.post(
+  "/market_data/historical/batch",
+  operation_id="get_historical_data_batch",
+  response_model=list[list[BarData]],
+)
+async def get_historical_data_batch(
+  requests: list[HistoricalDataRequest],
+) -> list[list[BarData]]:
+  """Get historical market data for several contracts at once.
+
+  Requests are fetched concurrently, which is faster than calling the
+  historical data endpoint once per symbol.
+
+  Args:
+    requests: List of historical data requests, one per contract
+
+  Returns:
+    List of historical bar data per request, in request order
+
+  Example:
+    >>> await get_historical_data_batch([
+    ...   {"symbol": "AAPL", "duration": "1 D", "bar_size": "5 mins"},
+    ...   {"symbol": "MSFT", "duration": "1 D", "bar_size": "5 mins"}
+    ... ])
+    [
+      [{"date": "2024-01-15T09:30:00", "open": 150.25, "close": 150.75, ...}],
+      [{"date": "2024-01-15T09:30:00", "open": 380.10, "close": 380.55, ...}]
+    ]
+  """
+  try:
+    logger.debug(f"Getting historical data for {len(requests)} requests")
+    return await ib_interface.get_historical_data_many(requests)
+  except Exception as e:
+    logger.error(f"Error in get_historical_data_batch: {e}")
+    return JSONResponse(
+      status_code=500,
+      content={"error": str(e), "message": "Failed to get historical data"}
+    )
+
+
 @ibkr_router.get(
   "/market_data/snapshot",
   operation_id="get_market_data_snapshot",
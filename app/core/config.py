@@ -13,6 +13,7 @@ class Config(BaseSettings):
   # Non-essential parameters
   enable_file_logging: bool = False
   log_file_path: str = "logs/app.log"
+  options_chain_cache_dir: str = ".cache/options_chains"
 
   # IBKR Gateway parameters
   ib_gateway_persist: bool = False
@@ -20,6 +21,7 @@ class Config(BaseSettings):
   ib_gateway_port: int = 8888
   ib_command_server_port: int = 7462
   ib_gateway_tradingmode: str = "paper"
+  ib_request_timeout: int = 20
 
 
 class ConfigManager:
@@ -59,7 +59,7 @@ class IBKRGatewayDockerService:
       try:
         existing_container = self.client.containers.get(self.container_name)
         if existing_container.status == "running":
-          logger.debug(f"Container {self.container_name} is already running")
+          logger.debug("Container {} is already running", self.container_name)
           self.container = existing_container
           return True
         existing_container.remove()
@@ -126,33 +126,48 @@ class IBKRGatewayDockerService:
     timer = 0
     while not await self.health_check():
       if timer > self._connection_timeout:
-        logger.error(f"IBKR Gateway not ready after {self._connection_timeout} seconds")
+        logger.error(
+          "IBKR Gateway not ready after {} seconds", self._connection_timeout)
         return False
       await asyncio.sleep(2)
       timer += 2
-    logger.debug(f"IBKR Gateway container is ready after {timer} seconds")
+    logger.debug("IBKR Gateway container is ready after {} seconds", timer)
     return True
 
+  def _get_container_info(self) -> dict[str, Any] | None:
+    """Get the container attributes, or None if the container does not exist."""
+    if self.container:
+      logger.debug("Getting container status from existing container")
+      return self.container.attrs
+    try:
+      return self.client.containers.get(self.container_name).attrs
+    except docker.errors.NotFound:
+      return None
+
+  async def _probe_health(self) -> str:
+    """Probe the gateway API and return its health status."""
+    try:
+      is_healthy = await self.health_check()
+    except Exception:
+      return "health_check_failed"
+    return "healthy" if is_healthy else "unhealthy"
+
   async def get_container_status(self) -> dict[str, Any]:
     """Get the status of the IBKR Gateway container."""
+    # Probe the API while Docker is queried, the probe is cancelled as soon
+    # as the lookup shows the container is missing or not running
+    probe = asyncio.create_task(self._probe_health())
     try:
-      # Check if container exists and get its status
-      if self.container:
-        logger.debug("Getting container status from existing container")
-        container_info = self.container.attrs
-      else:
-        try:
-          container = self.client.containers.get(self.container_name)
-          container_info = container.attrs
-        except docker.errors.NotFound:
-          return {
-            "status": "not_found",
-            "health": "unknown",
-            "created": None,
-            "started": None,
-            "finished": None,
-            "age": None,
-          }
+      container_info = await asyncio.to_thread(self._get_container_info)
+      if container_info is None:
+        return {
+          "status": "not_found",
+          "health": "unknown",
+          "created": None,
+          "started": None,
+          "finished": None,
+          "age": None,
+        }
 
       # Extract container state information
       state = container_info["State"]
@@ -165,14 +180,8 @@ class IBKRGatewayDockerService:
       created_time = datetime.fromisoformat(created)
       age = (datetime.now(UTC) - created_time).total_seconds()
 
-      # Perform health check if container is running
-      health_status = "unknown"
-      if status == "running":
-        try:
-          is_healthy = await self.health_check()
-          health_status = "healthy" if is_healthy else "unhealthy"
-        except Exception:
-          health_status = "health_check_failed"
+      # Health is only meaningful if the container is running
+      health_status = await probe if status == "running" else "unknown"
 
     except Exception:
       logger.exception("Failed to get container status")
@@ -193,6 +202,8 @@ class IBKRGatewayDockerService:
         "finished": finished,
         "age": age,
       }
+    finally:
+      probe.cancel()
 
   async def get_container_logs(self, tail: int = 100) -> str:
     """Get the logs from the IBKR Gateway container."""
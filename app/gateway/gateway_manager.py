@@ -1,4 +1,7 @@
 """Gateway manager for IBKR TWS Gateway."""
+import asyncio
+import random
+import time
 from typing import Any
 from .docker_service import IBKRGatewayDockerService
 from app.core.setup_logging import logger
@@ -6,6 +9,10 @@ from app.core.config import get_config
 
 config = get_config()
 
+# Gateway status cache lifetime in seconds, smudged by +/- this fraction
+STATUS_TTL = 2.0
+STATUS_TTL_JITTER = 0.15
+
 class IBKRGatewayManager:
   """Manager for IBKR Gateway container and interactions."""
 
@@ -13,6 +20,9 @@ class IBKRGatewayManager:
     """Initialize the IBKR Gateway manager."""
     self.docker_service = IBKRGatewayDockerService()
     self.is_running = False
+    self._status_cache: dict[str, Any] | None = None
+    self._status_expires_at = 0.0
+    self._status_lock = asyncio.Lock()
 
   async def start_gateway(self) -> bool:
     """Start the IBKR Gateway container."""
@@ -20,6 +30,7 @@ class IBKRGatewayManager:
       success = await self.docker_service.start_gateway()
       if success:
         self.is_running = True
+        self._status_cache = None
         logger.debug("IBKR Gateway started successfully")
     except Exception:
       logger.exception("Failed to start gateway")
@@ -35,6 +46,7 @@ class IBKRGatewayManager:
       )
       if success:
         self.is_running = False
+        self._status_cache = None
         logger.debug("IBKR Gateway stopped successfully")
     except Exception:
       logger.exception("Failed to stop gateway")
@@ -43,20 +55,36 @@ class IBKRGatewayManager:
       return success
 
   async def get_gateway_status(self) -> dict[str, Any]:
-    """Get the current status of the IBKR Gateway."""
-    try:
-      container_status = await self.docker_service.get_container_status()
-    except Exception as e:
-      logger.error(f"Failed to get gateway status: {e}")
-      return {
-        "is_running": False,
-        "error": str(e),
-      }
-    else:
-      return {
+    """Get the current status of the IBKR Gateway.
+
+    The container status is cached for a jittered TTL and refreshed by a
+    single caller at a time, so concurrent pollers share one Docker call.
+    """
+    if self._status_cache is not None and time.monotonic() < self._status_expires_at:
+      return self._status_cache
+
+    async with self._status_lock:
+      # Another caller may have refreshed the status while we waited
+      if (self._status_cache is not None and
+          time.monotonic() < self._status_expires_at):
+        return self._status_cache
+
+      try:
+        container_status = await self.docker_service.get_container_status()
+      except Exception as e:
+        logger.error("Failed to get gateway status: {}", e)
+        return {
+          "is_running": False,
+          "error": str(e),
+        }
+
+      self._status_cache = {
         "is_running": self.is_running,
         "container": container_status,
       }
+      jitter = random.uniform(-STATUS_TTL_JITTER, STATUS_TTL_JITTER)  # noqa: S311
+      self._status_expires_at = time.monotonic() + STATUS_TTL * (1 + jitter)
+      return self._status_cache
 
   async def get_gateway_logs(self, tail: int = 100) -> str:
     """Get the logs from the IBKR Gateway container."""
@@ -78,7 +106,7 @@ class IBKRGatewayManager:
           hasattr(self.docker_service, "client")):
         self.docker_service.client.close()
     except Exception as e:
-      logger.error(f"Error during cleanup: {e}")
+      logger.error("Error during cleanup: {}", e)
     finally:
       self.is_running = False
 
@@ -6,7 +6,7 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from app.api import gateway
-from app.api.ibkr import ibkr_router
+from app.api.ibkr import ib_interface, ibkr_router
 from app.core.setup_logging import setup_logging
 
 logger = setup_logging()
@@ -30,6 +30,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
   # Shutdown
   logger.info("Shutting down IBKR MCP Server...")
 
+  # Close the shared IB and IBC command server connections
+  if ib_interface.ib.isConnected():
+    ib_interface.ib.disconnect()
+  await ib_interface.close_ibc_connection()
+
   # Cleanup gateway
   try:
     await gateway.gateway_manager.cleanup()
@@ -1,7 +1,7 @@
 """Models package."""
 from .ticker import TickerData, GreeksData
 from .scanner import ScannerFilter, ScannerRequest
-from .account import AccountSummary, AccountValue, Position
+from .account import AccountDashboard, AccountSummary, AccountValue, Position
 from .trading import (
   OrderAction, OrderType, OrderStatus, TimeInForce, SecType,
   ContractRequest, OrderRequest, PlaceOrderRequest, OrderResponse,
@@ -18,6 +18,7 @@ __all__ = [
   "ScannerFilter",
   "ScannerRequest",
   # Account models
+  "AccountDashboard",
   "AccountSummary",
   "AccountValue",
   "Position",
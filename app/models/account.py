@@ -2,6 +2,8 @@
 from decimal import Decimal
 from pydantic import BaseModel, Field
 
+from .connection import ConnectionStatus
+
 
 class AccountSummary(BaseModel):
   """Account summary information."""
@@ -36,3 +38,11 @@ class Position(BaseModel):
   unrealized_pnl: float | None = Field(None, description="Unrealized P&L")
   realized_pnl: float | None = Field(None, description="Realized P&L")
   contract_id: int | None = Field(None, description="Contract ID")
+
+
+class AccountDashboard(BaseModel):
+  """Account summary, positions and connection status in one response."""
+
+  summary: list[AccountSummary] = Field(..., description="Account summary items")
+  positions: list[Position] = Field(..., description="Detailed positions")
+  connection: ConnectionStatus = Field(..., description="Connection status")
@@ -13,7 +13,7 @@ class BarData(BaseModel):
   low: float = Field(..., description="Low price")
   close: float = Field(..., description="Close price")
   volume: int = Field(..., description="Volume")
-  wap: float | None = Field(None, description="Weighted average price")
+  wap: float | None = Field(None, description="Weighted average price of the bar")
   count: int | None = Field(None, description="Trade count")
 
 
@@ -1,6 +1,11 @@
 """Pydantic models for scanner operations."""
+import re
+
 from pydantic import BaseModel, Field, field_validator
 
+# Location codes look like STK.US, STK.US.MAJOR or STK.EU.IBIS-ETF
+_LOCATION_CODE_RE = re.compile(r"^[A-Z]+\.[A-Z0-9._-]+$")
+
 
 class ScannerFilter(BaseModel):
   """Model for a single scanner filter."""
@@ -36,10 +41,11 @@ class ScannerRequest(BaseModel):
   @classmethod
   def validate_location_code(cls, v: str) -> str:
     """Validate location code format."""
-    if not v or "." not in v:
+    code = v if v.isupper() else v.upper()
+    if not _LOCATION_CODE_RE.match(code):
       error_msg = f"Invalid location code '{v}'. Expected format: 'TYPE.LOCATION'"
       raise ValueError(error_msg)
-    return v.upper()
+    return code
 
   def get_filter_codes(self) -> list[str]:
     """Get list of filter codes in 'parameter=value' format."""
@@ -1,8 +1,10 @@
 """Account management service."""
 import asyncio
+from ib_async import Position as IBPosition, Ticker
 from app.services.client import IBClient
 from app.core.setup_logging import logger
 from app.models import AccountSummary, AccountValue, Position
+from app.util.numbers import valid_value
 
 
 class AccountClient(IBClient):
@@ -20,15 +22,10 @@ class AccountClient(IBClient):
     await self._connect()
     
     try:
-      summary_items = self.ib.accountSummary()
-      
-      if not summary_items:
-        self.ib.reqAccountUpdates(True)
-        await asyncio.sleep(2)
-        summary_items = self.ib.accountSummary()
-      
+      summary_items = await self.ib.accountSummaryAsync()
+
       return [
-        AccountSummary(
+        AccountSummary.model_construct(
           account=item.account,
           tag=item.tag,
           value=item.value,
@@ -43,7 +40,7 @@ class AccountClient(IBClient):
         account_values = self.ib.accountValues()
         result = []
         for item in account_values[:10]:
-          result.append(AccountSummary(
+          result.append(AccountSummary.model_construct(
             account=item.account,
             tag=item.tag,
             value=item.value,
@@ -65,7 +62,7 @@ class AccountClient(IBClient):
     try:
       account_values = self.ib.accountValues()
       return [
-        AccountValue(
+        AccountValue.model_construct(
           account=item.account,
           key=item.tag,
           value=item.value,
@@ -87,43 +84,51 @@ class AccountClient(IBClient):
     
     try:
       positions = await self.ib.reqPositionsAsync()
-      result = []
-      
-      for pos in positions:
-        # Get market price if available
-        market_price = None
-        market_value = None
-        unrealized_pnl = None
-        
+
+      # Request market data snapshots for all positions in one batch; the
+      # library waits for each snapshot and cancels it once it has arrived
+      tickers = [None] * len(positions)
+      if positions:
         try:
-          # Request market data for the position
-          ticker = self.ib.reqMktData(pos.contract, '', True, False)
-          await asyncio.sleep(0.5)
-          
-          if ticker and ticker.last and str(ticker.last).lower() not in ['nan', 'inf', '-inf']:
-            market_price = float(ticker.last)
-            market_value = market_price * pos.position
-            unrealized_pnl = market_value - (pos.avgCost * pos.position)
-        except Exception as ticker_error:
-          logger.debug(f"Could not get market data for {pos.contract.symbol}: {ticker_error}")
-        
-        position = Position(
-          account=pos.account,
-          symbol=pos.contract.symbol,
-          sec_type=pos.contract.secType,
-          exchange=pos.contract.exchange,
-          currency=pos.contract.currency,
-          position=float(pos.position),
-          avg_cost=float(pos.avgCost),
-          market_price=market_price,
-          market_value=market_value,
-          unrealized_pnl=unrealized_pnl,
-          realized_pnl=None,  # Not available in position data
-          contract_id=pos.contract.conId if hasattr(pos.contract, 'conId') else None
-        )
-        result.append(position)
-      
-      return result
+          tickers = await asyncio.wait_for(
+            self.ib.reqTickersAsync(*[pos.contract for pos in positions]),
+            timeout=self.config.ib_request_timeout,
+          )
+        except TimeoutError:
+          logger.warning(
+            "Timed out getting market data for {} positions", len(positions),
+          )
+
+      return [
+        self._build_position(pos, ticker)
+        for pos, ticker in zip(positions, tickers, strict=True)
+      ]
     except Exception as e:
       logger.error(f"Failed to get positions: {e}")
       raise Exception(f"Positions error: {e}")
+
+  def _build_position(self, pos: IBPosition, ticker: Ticker | None) -> Position:
+    """Build a Position from an IB position and its market data ticker."""
+    market_price = None
+    market_value = None
+    unrealized_pnl = None
+
+    if ticker and (market_price := valid_value(ticker.last)):
+      market_value = market_price * pos.position
+      unrealized_pnl = market_value - (pos.avgCost * pos.position)
+
+    contract = pos.contract
+    return Position.model_construct(
+      account=pos.account,
+      symbol=contract.symbol,
+      sec_type=contract.secType,
+      exchange=contract.exchange,
+      currency=contract.currency,
+      position=float(pos.position),
+      avg_cost=float(pos.avgCost),
+      market_price=market_price,
+      market_value=market_value,
+      unrealized_pnl=unrealized_pnl,
+      realized_pnl=None,  # Not available in position data
+      contract_id=contract.conId if hasattr(contract, 'conId') else None
+    )
@@ -1,43 +1,174 @@
 """Base IB client connection handling."""
 import asyncio
-import datetime as dt
+import itertools
+import random
+import time
+from typing import ClassVar
+
 from ib_async import IB
 
 from app.core.config import get_config
 from app.core.setup_logging import logger
 
+# Process-unique client IDs, offset randomly so restarts rarely reuse an ID.
+# A new ID is drawn whenever the shared connection is re-established.
+_client_id_counter = itertools.count(random.randint(100, 900))  # noqa: S311
+
+# IB error code sent when another session already uses our client ID
+CLIENT_ID_IN_USE = 326
+
 class IBClient:
-  """Base IB client connection handling. No public methods."""
+  """Base IB client connection handling. No public methods.
+
+  All client instances share a single IB connection, so creating several
+  clients does not open several sessions with the gateway.
+  """
+
+  _ib: ClassVar[IB | None] = None
+  _client_id: ClassVar[int | None] = None
+  _connect_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+  # Monotonic time the last connection attempt gave up, for failing fast
+  _connect_failed_at: ClassVar[float | None] = None
+
+  # Shared IBC command server connection, reused across commands. The reader
+  # task consumes replies and finishes once IBC closes its end.
+  _ibc_writer: ClassVar[asyncio.StreamWriter | None] = None
+  _ibc_reader_task: ClassVar[asyncio.Task | None] = None
+  _ibc_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+
+  # Exponential backoff between connection attempts, in seconds. The whole
+  # retry loop runs under _connect_lock, so it is bounded by CONNECT_DEADLINE.
+  CONNECT_BACKOFF_BASE = 1.0
+  CONNECT_BACKOFF_CAP = 60.0
+  CONNECT_MAX_ATTEMPTS = 6
+  CONNECT_DEADLINE = 30.0
 
   def __init__(self) -> None:
     """Initialize IB interface."""
     self.config = get_config()
-    self.ib = IB()
+    if IBClient._ib is None:
+      IBClient._ib = IB()
+      # Cached contract data may be stale once the connection has dropped
+      IBClient._ib.disconnectedEvent += IBClient._clear_all_caches
+      IBClient._renew_client_id()
+    self.ib = IBClient._ib
+
+  @classmethod
+  def clear_caches(cls) -> None:
+    """Drop the caches of this client class, overridden by clients with caches."""
+
+  @staticmethod
+  def _clear_all_caches() -> None:
+    """Clear the caches of every client class, called on disconnect."""
+    seen: set[type[IBClient]] = set()
+    pending: list[type[IBClient]] = [IBClient]
+    while pending:
+      cls = pending.pop()
+      if cls in seen:
+        continue
+      seen.add(cls)
+      pending.extend(cls.__subclasses__())
+      if "clear_caches" in vars(cls):
+        cls.clear_caches()
+
+  @classmethod
+  def _renew_client_id(cls) -> None:
+    """Switch the shared connection to the next unused client ID.
+
+    Must only be called while the shared IB client is disconnected.
+    """
+    IBClient._client_id = next(_client_id_counter)
 
   async def _connect(self) -> None:
-    """Create and connect IB client."""
+    """Connect the shared IB client if it is not connected yet.
+
+    Callers that queued behind a connection attempt which then failed get a
+    ConnectionError right away instead of starting another round of retries.
+    """
     if self.ib.isConnected():
       return
 
+    waiting_since = time.monotonic()
+    async with self._connect_lock:
+      # Another caller may have connected while we waited for the lock
+      if self.ib.isConnected():
+        return
+
+      failed_at = IBClient._connect_failed_at
+      if failed_at is not None and failed_at >= waiting_since:
+        msg = "IB gateway is unavailable, the last connection attempt failed"
+        raise ConnectionError(msg)
+
+      try:
+        await self._connect_with_retries()
+      except Exception:
+        IBClient._connect_failed_at = time.monotonic()
+        raise
+
+  async def _connect_with_retries(self) -> None:
+    """Connect with exponential backoff, bounded by CONNECT_DEADLINE overall.
+
+    The caller must hold _connect_lock.
+    """
     host = self.config.ib_gateway_host
     port = self.config.ib_gateway_port
+    deadline = time.monotonic() + self.CONNECT_DEADLINE
+
+    # Error 326 means the client ID is taken, retrying with it cannot succeed
+    client_id_in_use = False
+
+    def on_error(_req_id: int, error_code: int, *_args: object) -> None:
+      nonlocal client_id_in_use
+      if error_code == CLIENT_ID_IN_USE:
+        client_id_in_use = True
 
+    self.ib.errorEvent += on_error
     try:
-      await self.ib.connectAsync(
-        host=host,
-        port=port,
-        clientId=dt.datetime.now(dt.UTC).strftime("%H%M%S"),
-        timeout=20,
-        readonly=False,
-      )
-      self.ib.RequestTimeout = 20
-    except Exception as e:
-      logger.error("Error connecting to IB: {}", e)
-      raise
+      for attempt in range(self.CONNECT_MAX_ATTEMPTS):
+        try:
+          await self.ib.connectAsync(
+            host=host,
+            port=port,
+            clientId=self._client_id,
+            timeout=min(
+              self.config.ib_request_timeout,
+              max(deadline - time.monotonic(), 1.0),
+            ),
+            readonly=False,
+          )
+        except Exception as e:
+          if client_id_in_use:
+            client_id_in_use = False
+            self._renew_client_id()
+            logger.warning("Client ID in use, switching to {}", self._client_id)
+
+          delay = min(
+            self.CONNECT_BACKOFF_CAP,
+            self.CONNECT_BACKOFF_BASE * 2 ** attempt,
+          ) + random.uniform(0, self.CONNECT_BACKOFF_BASE)  # noqa: S311
+          last_attempt = attempt == self.CONNECT_MAX_ATTEMPTS - 1
+          if last_attempt or time.monotonic() + delay >= deadline:
+            logger.error("Error connecting to IB: {}", e)
+            raise
+
+          logger.warning(
+            "Error connecting to IB (attempt {}/{}), retrying in {:.1f}s: {}",
+            attempt + 1, self.CONNECT_MAX_ATTEMPTS, delay, e,
+          )
+          await asyncio.sleep(delay)
+        else:
+          self.ib.RequestTimeout = self.config.ib_request_timeout
+          return
+    finally:
+      self.ib.errorEvent -= on_error
 
   async def send_command_to_ibc(self, command: str) -> None:
     """Send a command to the IBC Command Server.
 
+    The connection to the command server is kept open and reused for later
+    commands. It is reopened once IBC has closed its end, and if sending
+    fails on a reused connection the command is sent once more.
+
     Args:
         command: The command to send to the IBC Command Server
 
@@ -46,30 +177,73 @@ class IBClient:
       logger.error("Error: you must supply a valid IBC command")
       return
 
-    host = self.config.ib_gateway_host
-    port = self.config.ib_command_server_port
+    async with self._ibc_lock:
+      try:
+        try:
+          await self._write_ibc_command(command)
+        except (ConnectionError, OSError) as e:
+          logger.debug("IBC connection lost, reconnecting: {}", e)
+          await self._close_ibc_writer()
+          await self._write_ibc_command(command)
 
-    try:
-      # Create connection
-      reader, writer = await asyncio.open_connection(host, port)
+        logger.debug("Successfully sent command to IBC: {}", command)
+      except Exception as e:
+        logger.error("Error sending command to IBC: {}", str(e))
+        await self._close_ibc_writer()
+        raise
 
-      # Send command
-      writer.write(command.encode() + b"\n")
-      await writer.drain()
+  async def close_ibc_connection(self) -> None:
+    """Close the shared IBC Command Server connection, if open."""
+    async with self._ibc_lock:
+      await self._close_ibc_writer()
 
-      # Close connection
-      writer.close()
-      await writer.wait_closed()
+  async def _write_ibc_command(self, command: str) -> None:
+    """Write a command on the shared IBC connection, opening it if needed."""
+    writer = IBClient._ibc_writer
+    reader_task = IBClient._ibc_reader_task
+    # When IBC closes its end (e.g. after RESTART) our transport stays half
+    # open and writes succeed silently, only the reader sees the EOF
+    if (
+      writer is None
+      or writer.is_closing()
+      or reader_task is None
+      or reader_task.done()
+    ):
+      await self._close_ibc_writer()
+      reader, writer = await asyncio.open_connection(
+        self.config.ib_gateway_host,
+        self.config.ib_command_server_port,
+      )
+      IBClient._ibc_writer = writer
+      IBClient._ibc_reader_task = asyncio.create_task(
+        self._read_ibc_replies(reader),
+      )
+
+    writer.write(command.encode() + b"\n")
+    await writer.drain()
 
-      logger.debug("Successfully sent command to IBC: {}", command)
-    except Exception as e:
-      logger.error("Error sending command to IBC: {}", str(e))
-      raise
+  @staticmethod
+  async def _read_ibc_replies(reader: asyncio.StreamReader) -> None:
+    """Log IBC replies until the command server closes the connection."""
+    try:
+      while line := await reader.readline():
+        logger.debug("IBC reply: {}", line.decode(errors="replace").strip())
+    except (ConnectionError, OSError) as e:
+      logger.debug("IBC connection lost: {}", e)
+
+  async def _close_ibc_writer(self) -> None:
+    """Close the shared IBC connection; the caller must hold _ibc_lock."""
+    writer = IBClient._ibc_writer
+    reader_task = IBClient._ibc_reader_task
+    IBClient._ibc_writer = None
+    IBClient._ibc_reader_task = None
+    if reader_task is not None:
+      reader_task.cancel()
+    if writer is None:
+      return
 
-  def __del__(self) -> None:
-    """Disconnect from IB."""
+    writer.close()
     try:
-      if self.ib and self.ib.isConnected():
-        self.ib.disconnect()
-    except Exception:
-      logger.warning("Error disconnecting from IB")
+      await writer.wait_closed()
+    except (ConnectionError, OSError) as e:
+      logger.debug("Error closing IBC connection: {}", e)
@@ -3,7 +3,6 @@ import asyncio
 from app.services.client import IBClient
 from app.core.setup_logging import logger
 from app.models import ConnectionStatus, ReconnectResponse
-from app.core.config import get_config
 
 
 class ConnectionClient(IBClient):
@@ -15,8 +14,8 @@ class ConnectionClient(IBClient):
     Returns:
       Connection status information
     """
-    config = get_config()
-    
+    config = self.config
+
     try:
       is_connected = self.ib.isConnected()
       
@@ -32,7 +31,7 @@ class ConnectionClient(IBClient):
         connected=is_connected,
         host=config.ib_gateway_host,
         port=config.ib_gateway_port,
-        client_id=None,  # Client ID is dynamic per connection
+        client_id=str(self._client_id),
         accounts=accounts if accounts else []
       )
     except Exception as e:
@@ -41,7 +40,7 @@ class ConnectionClient(IBClient):
         connected=False,
         host=config.ib_gateway_host,
         port=config.ib_gateway_port,
-        client_id=None,
+        client_id=str(self._client_id),
         accounts=[]
       )
 
@@ -57,7 +56,10 @@ class ConnectionClient(IBClient):
         logger.info("Disconnecting from IBKR Gateway...")
         self.ib.disconnect()
         await asyncio.sleep(1)
-      
+
+      # The gateway may not have released the old client ID yet
+      self._renew_client_id()
+
       # Attempt to reconnect
       logger.info("Attempting to reconnect to IBKR Gateway...")
       await self._connect()
@@ -1,16 +1,30 @@
 """Contract operations."""
+import copy
+import datetime as dt
+import functools
+import itertools
+import json
+from collections.abc import Sequence
 from typing import List, Dict, Any
 
-from ib_async import util
 from ib_async.contract import Contract, Option
+from ib_async.objects import OptionChain
 
 from app.core.setup_logging import logger
-from app.util.convert_camel_to_snake_case import (
-  convert_df_columns_to_snake_case,
-  obj_to_dict_snake_case,
-)
+from app.util.batching import gather_in_chunks
+from app.util.convert_camel_to_snake_case import obj_to_dict_snake_case
+from app.util.file_cache import FileCache
+from app.util.ttl_cache import TTLCache
 from .client import IBClient
 
+# Option chain parameters persisted on disk are kept for a week
+OPTION_PARAMS_FILE_MAX_AGE = 7 * 86400
+
+# Option qualification is sharded by expiration and split into chunks to
+# stay under IB pacing limits
+QUALIFY_CHUNK_SIZE = 50
+QUALIFY_MAX_CONCURRENCY = 4
+
 class ContractClient(IBClient):
   """Contract operations.
 
@@ -20,6 +34,26 @@ class ContractClient(IBClient):
 
   """
 
+  # Shared across instances, cleared on disconnect via clear_caches()
+  _contract_details_cache = TTLCache(maxsize=4096, ttl=3600)
+  _option_params_cache = TTLCache(maxsize=1024, ttl=86400)
+  _option_params_file_cache: FileCache | None = None
+
+  def __init__(self) -> None:
+    """Initialize the ContractClient."""
+    super().__init__()
+    if ContractClient._option_params_file_cache is None:
+      ContractClient._option_params_file_cache = FileCache(
+        self.config.options_chain_cache_dir,
+        max_age=OPTION_PARAMS_FILE_MAX_AGE,
+      )
+
+  @classmethod
+  def clear_caches(cls) -> None:
+    """Drop all cached contract details and option chain parameters."""
+    cls._contract_details_cache.clear()
+    cls._option_params_cache.clear()
+
   async def get_contract_details(
       self,
       symbol: str,
@@ -59,6 +93,19 @@ class ContractClient(IBClient):
         or list of contract candidates if multiple matches are found.
 
     """
+    cache_key = (
+      symbol,
+      sec_type,
+      exchange,
+      primary_exchange,
+      currency,
+      json.dumps(options, sort_keys=True, default=str),
+    )
+    # Callers get their own copy, so mutating a result cannot corrupt the cache
+    cached = self._contract_details_cache.get(cache_key)
+    if cached is not None:
+      return copy.deepcopy(cached)
+
     try:
       await self._connect()
 
@@ -83,48 +130,158 @@ class ContractClient(IBClient):
       )
 
       while True:
-        contracts = await self.ib.qualifyContractsAsync(contract, returnAll=True)
-        if not contracts or contracts[0] is None:
-          return []
-
-        # contracts[0] is either a Contract or a list of Contracts (if ambiguous and returnAll=True)
-        if isinstance(contracts[0], list):
-          contract_list = contracts[0]
-          filtered = [
-            c
-            for c in contract_list
-            if c is not None
-            and (exchange is None or c.exchange == exchange)
-            and (primary_exchange is None or c.primaryExchange == primary_exchange)
-            and (currency is None or c.currency == currency)
-          ]
-
-          # If we have exactly 1 match, re-qualify with that contract
-          if len(filtered) == 1:
-            contract = filtered[0]
+        candidates = await self._qualify_candidates(contract)
+
+        # A single candidate is unambiguous, otherwise narrow down by listing
+        if len(candidates) > 1:
+          candidates = self._filter_candidates(
+            candidates, exchange, primary_exchange, currency,
+          )
+
+          # Candidates come from contract details, so only a single match
+          # without a conId needs to be re-qualified
+          if len(candidates) == 1 and not candidates[0].conId:
+            contract = candidates[0]
             continue
 
-          # Convert Contract objects to dicts with snake_case keys
-          return [obj_to_dict_snake_case(c) for c in filtered]
+        # Convert Contract objects to dicts with snake_case keys
+        if len(candidates) == 1:
+          result = obj_to_dict_snake_case(candidates[0])
         else:
-          contracts = convert_df_columns_to_snake_case(util.df(contracts))
-          # contracts = contracts[[
-          #   "con_id",
-          #   "symbol",
-          #   "sec_type",
-          #   "exchange",
-          #   "primary_exchange",
-          #   "currency",
-          #   "local_symbol",
-          #   "multiplier",
-          # ]]
-          # Return single contract as dict
-          return contracts.iloc[0].to_dict()
+          result = [obj_to_dict_snake_case(c) for c in candidates]
+        if result:
+          self._contract_details_cache.set(cache_key, copy.deepcopy(result))
+        return result
 
     except Exception as e:
       logger.error("Error getting contract details: {}", str(e))
       raise
 
+  async def _qualify_candidates(self, contract: Contract) -> List[Contract]:
+    """Qualify a contract and return all matching candidates.
+
+    Args:
+      contract: Contract to qualify.
+
+    Returns:
+      The qualified contract as a single-element list, all candidates if the
+      contract is ambiguous, or an empty list if nothing matches.
+
+    """
+    qualified = await self.ib.qualifyContractsAsync(contract, returnAll=True)
+    if not qualified or qualified[0] is None:
+      return []
+
+    # With returnAll=True an ambiguous contract yields a list of candidates
+    match = qualified[0]
+    return match if isinstance(match, list) else [match]
+
+  @staticmethod
+  def _filter_candidates(
+    candidates: List[Contract | None],
+    exchange: str | None,
+    primary_exchange: str | None,
+    currency: str | None,
+  ) -> List[Contract]:
+    """Filter ambiguous contract candidates by listing.
+
+    Candidates are indexed by (exchange, primary exchange, currency) with
+    duplicate conIds dropped. A fully specified listing is a single lookup;
+    None parameters act as wildcards over the index keys.
+
+    Args:
+      candidates: Contracts returned for an ambiguous qualification.
+      exchange: Exchange to match, or None for any.
+      primary_exchange: Primary exchange to match, or None for any.
+      currency: Currency to match, or None for any.
+
+    Returns:
+      Unique candidates matching the given listing.
+
+    """
+    index: Dict[tuple[str, str, str], List[Contract]] = {}
+    seen_con_ids = set()
+    for c in candidates:
+      if c is None or c.conId in seen_con_ids:
+        continue
+      seen_con_ids.add(c.conId)
+      index.setdefault((c.exchange, c.primaryExchange, c.currency), []).append(c)
+
+    wanted = (exchange, primary_exchange, currency)
+    if None not in wanted:
+      return index.get(wanted, [])
+
+    return [
+      c
+      for key, group in index.items()
+      if all(w is None or w == k for w, k in zip(wanted, key, strict=True))
+      for c in group
+    ]
+
+  async def _get_option_params(
+    self,
+    underlying_symbol: str,
+    underlying_sec_type: str,
+    underlying_con_id: int,
+  ) -> List[OptionChain]:
+    """Get option chain parameters through the memory and file caches.
+
+    Args:
+      underlying_symbol: Symbol of the underlying contract.
+      underlying_sec_type: Security type of the underlying contract.
+      underlying_con_id: ConID of the underlying contract.
+
+    Returns:
+      Option chain parameters of the underlying, possibly empty.
+
+    """
+    params_key = (underlying_symbol, underlying_sec_type, underlying_con_id)
+    chains = self._option_params_cache.get(params_key)
+    if chains is not None:
+      return chains
+
+    # Chains change at most once per trading day, so persist them per day
+    file_key = f"{underlying_con_id}_{dt.datetime.now(dt.UTC).date().isoformat()}"
+    chains = await self._option_params_file_cache.get(file_key)
+    if chains is None:
+      chains = await self.ib.reqSecDefOptParamsAsync(
+        underlyingSymbol=underlying_symbol,
+        futFopExchange="",
+        underlyingSecType=underlying_sec_type,
+        underlyingConId=underlying_con_id,
+      )
+      if chains:
+        await self._option_params_file_cache.set(file_key, chains)
+    if chains:
+      self._option_params_cache.set(params_key, chains)
+    return chains or []
+
+  @staticmethod
+  def _filter_chain(
+    chain: OptionChain,
+    filters: dict,
+  ) -> tuple[List[str], List[str], List[float], List[str]]:
+    """Apply the options chain filters to a selected chain.
+
+    Args:
+      chain: Selected option chain.
+      filters: Filters as accepted by get_options_chain, empty for none.
+
+    Returns:
+      Trading classes, expirations, strikes and rights to generate.
+
+    """
+    def keep(values: Sequence, name: str) -> list:
+      wanted = filters.get(name)
+      return list(values) if wanted is None else [v for v in values if v in wanted]
+
+    return (
+      keep([chain.tradingClass], "trading_class"),
+      keep(chain.expirations, "expirations"),
+      keep(chain.strikes, "strikes"),
+      filters.get("rights", ["C", "P"]),
+    )
+
   async def get_options_chain(
     self,
     underlying_symbol: str,
@@ -155,89 +312,83 @@ class ContractClient(IBClient):
     try:
       await self._connect()
 
-      while True:
-        chains = await self.ib.reqSecDefOptParamsAsync(
-          underlyingSymbol=underlying_symbol,
-          futFopExchange="",
-          underlyingSecType=underlying_sec_type,
-          underlyingConId=underlying_con_id,
-        )
-
-        #  new comment to test kilo
+      chains = await self._get_option_params(
+        underlying_symbol, underlying_sec_type, underlying_con_id,
+      )
 
-        if not chains:
-          return []
+      # Filter chains by exchange if specified
+      filtered_chains = [
+        chain for chain in chains or []
+        if exchange is None or chain.exchange == exchange
+      ]
 
-        # Convert to DataFrame for easier handling
-        chains_df = util.df(chains)
-        if chains_df is None or chains_df.empty:
-          return []
+      # If no chains match the exchange filter, return empty
+      if not filtered_chains:
+        return []
+
+      # If we have multiple chains, return candidates with snake_case keys
+      if len(filtered_chains) > 1:
+        return [
+          {
+            "exchange": chain.exchange,
+            "underlying_con_id": chain.underlyingConId,
+            "trading_class": chain.tradingClass,
+            # Copied, the chain's lists are shared with the parameter caches
+            "expirations": list(chain.expirations),
+            "strikes": list(chain.strikes),
+          }
+          for chain in filtered_chains
+        ]
+
+      # We have a single selected chain, apply the filters to its data
+      selected_chain = filtered_chains[0]
+      trading_classes, expirations, strikes, rights = self._filter_chain(
+        selected_chain, filters or {},
+      )
 
-        # Filter chains by exchange if specified
-        if exchange is not None:
-          filtered_chains = chains_df[chains_df["exchange"] == exchange]
-        else:
-          filtered_chains = chains_df
-
-        # If we have exactly 1 chain, use it
-        if len(filtered_chains) == 1:
-          selected_chain = filtered_chains.iloc[0]
-          break
-
-        # If we have multiple chains and no exchange filter, return candidates
-        if len(filtered_chains) > 1 and exchange is None:
-          # Return list of candidate chains with snake_case columns
-          candidate_chains = filtered_chains[[
-            "exchange",
-            "underlyingConId",
-            "tradingClass",
-            "expirations",
-            "strikes",
-          ]]
-          return convert_df_columns_to_snake_case(candidate_chains).to_dict(orient="records")
-
-        # If no chains match the exchange filter, return empty
-        if len(filtered_chains) == 0:
-          return []
-
-      # We have a single selected chain, extract its data
-      trading_classes = [selected_chain["tradingClass"]]
-      expirations = selected_chain["expirations"]
-      strikes = selected_chain["strikes"]
-
-      # Apply filters if provided
-      if filters:
-        if "trading_class" in filters:
-          trading_classes = [tc for tc in trading_classes if tc in filters["trading_class"]]
-        if "expirations" in filters:
-          expirations = [e for e in expirations if e in filters["expirations"]]
-        if "strikes" in filters:
-          strikes = [s for s in strikes if s in filters["strikes"]]
-        rights = filters.get("rights", ["C", "P"])
-      else:
-        rights = ["C", "P"]
-
-      # Generate option contracts using data from selected chain
+      # Generate option contracts using data from selected chain, ordered by
+      # right, then strike, then expiry
+      chain_exchange = selected_chain.exchange
+      combinations = list(itertools.product(
+        rights, strikes, expirations, trading_classes,
+      ))
       contracts = [
         Option(
           symbol=underlying_symbol,
           lastTradeDateOrContractMonth=expiry,
           strike=strike,
           right=right,
-          exchange=selected_chain["exchange"],
-          tradingClass=selected_chain["tradingClass"],
+          exchange=chain_exchange,
+          tradingClass=trading_class,
         )
-        for right in rights
-        for strike in strikes
-        for expiry in expirations
-        for trading_class in trading_classes
+        for right, strike, expiry, trading_class in combinations
       ]
 
       try:
-        contracts = await self.ib.qualifyContractsAsync(*contracts, returnAll=True)
-        contracts = [c for c in contracts if c is not None]
-        contracts = convert_df_columns_to_snake_case(util.df(contracts))
-        return contracts.to_dict(orient="records")
+        contracts = await gather_in_chunks(
+          functools.partial(self.ib.qualifyContractsAsync, returnAll=True),
+          contracts,
+          chunk_size=QUALIFY_CHUNK_SIZE,
+          max_concurrency=QUALIFY_MAX_CONCURRENCY,
+          timeout=self.config.ib_request_timeout,
+          key=lambda option: option.lastTradeDateOrContractMonth,
+        )
+        # Sharding groups the results by expiry, restore the generated order.
+        # Ambiguous contracts come back as candidate lists and sort last.
+        position = {combination: i for i, combination in enumerate(combinations)}
+        contracts = sorted(
+          (c for c in contracts if c is not None),
+          key=lambda c: position.get(
+            (
+              getattr(c, "right", None),
+              getattr(c, "strike", None),
+              getattr(c, "lastTradeDateOrContractMonth", None),
+              getattr(c, "tradingClass", None),
+            ),
+            len(position),
+          ),
+        )
+        return [obj_to_dict_snake_case(c) for c in contracts]
       except Exception as e:
         logger.warning("Error qualifying contracts: {}", str(e))
         raise
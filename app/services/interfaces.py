@@ -1,4 +1,7 @@
 """Main IB interface combining all functionality."""
+import asyncio
+
+from app.models import AccountDashboard
 from .market_data import MarketDataClient
 from .contracts import ContractClient
 from .scanners import ScannerClient
@@ -17,3 +20,25 @@ class IBInterface(
   ConnectionClient,
 ):
   """Main IB interface combining all functionality."""
+
+  async def get_dashboard(self) -> AccountDashboard:
+    """Get account summary and positions concurrently, then connection status.
+
+    The account requests are independent, so they are issued together over
+    the shared connection instead of one after another. The connection
+    status is read once they are done, as they connect the client first.
+
+    Returns:
+      Account dashboard with summary, positions and connection status.
+
+    """
+    summary, positions = await asyncio.gather(
+      self.get_account_summary(),
+      self.get_positions_detailed(),
+    )
+    connection = await self.get_connection_status()
+    return AccountDashboard.model_construct(
+      summary=summary,
+      positions=positions,
+      connection=connection,
+    )
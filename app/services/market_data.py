@@ -1,84 +1,291 @@
 """Market data operations."""
 import asyncio
-import pandas as pd
-import exchange_calendars as ecals
 import datetime as dt
-from ib_async import util
+import math
+import time
+from typing import TYPE_CHECKING
+from ib_async import IB, Ticker
 from ib_async.contract import Contract
 
 from .client import IBClient
 from .contracts import ContractClient
 from app.core.setup_logging import logger
-from app.models import TickerData, GreeksData, BarData, TickData
+from app.models import TickerData, GreeksData, BarData, TickData, HistoricalDataRequest
+from app.util.batching import gather_in_chunks
+from app.util.numbers import valid_value
+from app.util.ttl_cache import TTLCache
+
+if TYPE_CHECKING:
+  import exchange_calendars as ecals
+
+# Trading calendars by exchange, built once per process
+_CAL_CACHE: dict[str, "ecals.ExchangeCalendar"] = {}
+
+# Last market state by exchange as (monotonic time, is open), reused briefly
+_MKT_STATE: dict[str, tuple[float, bool]] = {}
+MARKET_STATE_TTL = 30.0
+
+# Ticker requests are split into chunks to stay under IB pacing limits
+TICKERS_CHUNK_SIZE = 50
+TICKERS_MAX_CONCURRENCY = 4
+
+# Maximum number of historical data requests in flight at once
+HISTORICAL_MAX_CONCURRENCY = 5
+
+# Historical bars end at the current time, so they are cached for at most
+# one bar interval and never longer than this, in seconds
+HISTORICAL_MAX_TTL = 60.0
+
+# Upper bound on how long a snapshot waits for all of its fields, in seconds
+SNAPSHOT_WAIT = 2.0
+
+
+def _nan_to_none(value: float | None) -> float | None:
+  """Return value as a float, or None if it is missing or NaN."""
+  if value is None or math.isnan(value):
+    return None
+  return float(value)
+
+
+def _historical_ttl(bar_size: str) -> float:
+  """Return how long bars of the given size may be served from cache."""
+  count, _, unit = bar_size.partition(" ")
+  if unit.startswith("sec"):
+    try:
+      return min(float(count), HISTORICAL_MAX_TTL)
+    except ValueError:
+      pass
+  return HISTORICAL_MAX_TTL
+
+
+def _copy_bars(bars: list[BarData]) -> list[BarData]:
+  """Return copies of bars, so cached bars are never shared with callers."""
+  return [bar.model_copy() for bar in bars]
+
+
+def _has_snapshot_fields(ticker: Ticker) -> bool:
+  """Return True if the ticker has every field reported in a snapshot."""
+  return all(
+    valid_value(value) is not None
+    for value in (
+      ticker.last,
+      ticker.bid,
+      ticker.ask,
+      ticker.bidSize,
+      ticker.askSize,
+      ticker.volume,
+    )
+  )
+
+
+class _QualifyBatcher:
+  """Coalesce contract ID qualification across concurrent callers.
+
+  Contract IDs submitted within a short window are qualified together in a
+  single qualifyContractsAsync request, and duplicate IDs share one result.
+  """
+
+  def __init__(self, ib: IB, window: float = 0.005) -> None:
+    """Initialize the batcher.
+
+    Args:
+      ib: IB client used to qualify contracts.
+      window: Time in seconds to collect requests before qualifying them.
+
+    """
+    self._ib = ib
+    self._window = window
+    self._pending: dict[int, asyncio.Future[Contract | None]] = {}
+    self._flush_task: asyncio.Task | None = None
+
+  async def qualify(self, con_ids: list[int]) -> list[Contract | None]:
+    """Qualify contracts by contract ID.
+
+    Args:
+      con_ids: Contract IDs to qualify.
+
+    Returns:
+      Qualified contracts in the order of con_ids, None where a contract
+      could not be qualified.
+
+    """
+    loop = asyncio.get_running_loop()
+    futures = []
+    for con_id in con_ids:
+      future = self._pending.get(con_id)
+      if future is None:
+        future = self._pending[con_id] = loop.create_future()
+      futures.append(future)
+
+    if self._flush_task is None:
+      self._flush_task = loop.create_task(self._flush())
+
+    # Use wait rather than gather so that a cancelled caller does not cancel
+    # futures shared with other callers
+    if futures:
+      await asyncio.wait(futures)
+    return [future.result() for future in futures]
+
+  async def _flush(self) -> None:
+    """Qualify all pending contract IDs in one request."""
+    await asyncio.sleep(self._window)
+    pending, self._pending = self._pending, {}
+    self._flush_task = None
+
+    try:
+      qualified = await self._ib.qualifyContractsAsync(
+        *[Contract(conId=con_id) for con_id in pending],
+      )
+    except Exception as e:
+      for future in pending.values():
+        if not future.done():
+          future.set_exception(e)
+      return
+
+    by_con_id = {c.conId: c for c in qualified if c is not None}
+    for con_id, future in pending.items():
+      if not future.done():
+        future.set_result(by_con_id.get(con_id))
+
 
 class MarketDataClient(IBClient):
   """Market data operations."""
 
+  # Qualified contracts by conId, shared across instances; a conId always
+  # identifies the same contract, so entries only expire to bound staleness
+  _qualified_contracts = TTLCache(maxsize=10000, ttl=86400)
+
+  # Historical bars by request, expiring according to the bar size
+  _historical_cache = TTLCache(maxsize=512, ttl=HISTORICAL_MAX_TTL)
+
+  @classmethod
+  def clear_caches(cls) -> None:
+    """Drop all cached qualified contracts and historical bars."""
+    cls._qualified_contracts.clear()
+    cls._historical_cache.clear()
+
   def __init__(self) -> None:
     """Initialize the MarketDataClient."""
     super().__init__()
     self.contract_client = ContractClient()
-    self.contract_client.ib = self.ib
+    self._qualify_batcher = _QualifyBatcher(self.ib)
+
+  async def _qualify_con_ids(self, con_ids: list[int]) -> list[Contract | None]:
+    """Qualify contracts by contract ID, reusing previously qualified ones.
+
+    Args:
+      con_ids: Contract IDs to qualify.
+
+    Returns:
+      Qualified contracts in the order of con_ids, None where a contract
+      could not be qualified.
+
+    """
+    contracts = {}
+    for con_id in con_ids:
+      contract = self._qualified_contracts.get(con_id)
+      if contract is not None:
+        contracts[con_id] = contract
+
+    missing = [con_id for con_id in dict.fromkeys(con_ids) if con_id not in contracts]
+    if missing:
+      qualified = await self._qualify_batcher.qualify(missing)
+      for con_id, contract in zip(missing, qualified, strict=True):
+        if contract is not None:
+          self._qualified_contracts.set(con_id, contract)
+          contracts[con_id] = contract
+
+    return [contracts.get(con_id) for con_id in con_ids]
+
+  async def _req_tickers(self, contracts: list[Contract]) -> list[Ticker]:
+    """Request ticker snapshots in bounded concurrent chunks.
+
+    Args:
+      contracts: Qualified contracts to request tickers for.
 
-  def _is_market_open(self) -> bool:
-      """Check if the market is open."""
-      nyse = ecals.get_calendar("NYSE")
-      return nyse.is_trading_minute(dt.datetime.now(dt.UTC))
+    Returns:
+      Tickers in the order of contracts.
+
+    """
+    return await gather_in_chunks(
+      self.ib.reqTickersAsync,
+      contracts,
+      chunk_size=TICKERS_CHUNK_SIZE,
+      max_concurrency=TICKERS_MAX_CONCURRENCY,
+      timeout=self.config.ib_request_timeout,
+    )
+
+  def _is_market_open(self, exchange: str = "NYSE") -> bool:
+    """Check if the market is open now.
+
+    The answer is reused for MARKET_STATE_TTL seconds.
+
+    Args:
+      exchange: Exchange calendar to check, as named by exchange_calendars.
 
-  def _process_tickers(self, tickers: list[dict]) -> list[TickerData]:
+    """
+    checked_at = time.monotonic()
+    cached = _MKT_STATE.get(exchange)
+    if cached and checked_at - cached[0] < MARKET_STATE_TTL:
+      return cached[1]
+
+    calendar = _CAL_CACHE.get(exchange)
+    if calendar is None:
+      # exchange_calendars is slow to import, load it on first use
+      import exchange_calendars as ecals  # noqa: PLC0415
+
+      calendar = _CAL_CACHE[exchange] = ecals.get_calendar(exchange)
+    is_open = calendar.is_trading_minute(dt.datetime.now(dt.UTC))
+    _MKT_STATE[exchange] = (checked_at, is_open)
+    return is_open
+
+  def _process_tickers(self, tickers: list[Ticker]) -> list[TickerData]:
     """Process tickers to extract required fields."""
-    result = util.df(tickers)
-    result["contractId"] = result["contract"].apply(lambda x: x.conId)
-    result["symbol"] = result["contract"].apply(lambda x: x.localSymbol)
-    result["secType"] = result["contract"].apply(lambda x: x.secType)
-    result["last"] = result["last"].astype(float)
-    result["bid"] = result["bid"].astype(float)
-    result["ask"] = result["ask"].astype(float)
-    result["greeks"] = result.apply(self._greek_extraction, axis=1)
-
-    # Convert DataFrame to list of Pydantic models
-    ticker_list = []
-    for _, row in result.iterrows():
-      ticker_data = TickerData(
-        contractId=row["contractId"],
-        symbol=row["symbol"],
-        secType=row["secType"],
-        last=row["last"] if pd.notna(row["last"]) else None,
-        bid=row["bid"] if pd.notna(row["bid"]) else None,
-        ask=row["ask"] if pd.notna(row["ask"]) else None,
-        greeks=row["greeks"],
+    # Fields come from typed IB objects, so skip pydantic validation
+    return [
+      TickerData.model_construct(
+        contractId=ticker.contract.conId,
+        symbol=ticker.contract.localSymbol,
+        secType=ticker.contract.secType,
+        last=_nan_to_none(ticker.last),
+        bid=_nan_to_none(ticker.bid),
+        ask=_nan_to_none(ticker.ask),
+        greeks=self._greek_extraction(ticker),
       )
-      ticker_list.append(ticker_data)
-
-    return ticker_list
+      for ticker in tickers
+    ]
 
-  def _greek_extraction(self, ticker: pd.Series) -> GreeksData | None:
+  @staticmethod
+  def _greek_extraction(ticker: Ticker) -> GreeksData | None:
     """Extract greeks from a ticker.
 
     Only extract greeks for options contracts, use modelGreeks.
     """
-    if (
-      ticker.secType == "OPT" and
-      hasattr(ticker, "modelGreeks") and
-      ticker.modelGreeks
-    ):
-      return GreeksData(
-        delta=ticker.modelGreeks.delta,
-        gamma=ticker.modelGreeks.gamma,
-        vega=ticker.modelGreeks.vega,
-        theta=ticker.modelGreeks.theta,
-        impliedVol=ticker.modelGreeks.impliedVol,
-      )
-    return None
+    if ticker.contract.secType != "OPT":
+      return None
+    greeks = ticker.modelGreeks
+    if greeks is None:
+      return None
+    return GreeksData.model_construct(
+      delta=greeks.delta,
+      gamma=greeks.gamma,
+      vega=greeks.vega,
+      theta=greeks.theta,
+      impliedVol=greeks.impliedVol,
+    )
 
   async def get_tickers(
       self,
       contract_ids: list[int],
-    ) -> list[dict]:
+      *,
+      require_greeks: bool = True,
+    ) -> list[TickerData]:
     """Get tickers for a list of contract IDs.
 
     Args:
         contract_ids: List of contract IDs to get tickers for.
+        require_greeks: Whether options need greeks. If so and none are
+          returned, the gateway is restarted and the request retried.
 
     Returns:
         List of tickers for the given contract IDs.
@@ -86,58 +293,42 @@ class MarketDataClient(IBClient):
     """
     try:
       await self._connect()
-      contracts = [Contract(conId=contract_id) for contract_id in contract_ids]
-      qualified_contracts = await self.ib.qualifyContractsAsync(*contracts)
+      qualified_contracts = [
+        c for c in await self._qualify_con_ids(contract_ids) if c is not None
+      ]
 
-      # First attempt to get tickers
-      if self._is_market_open():
-        logger.debug("Market is open, requesting live market data")
-        self.ib.reqMarketDataType(1)
-      else:
-        logger.debug("Market is closed, requesting delayed market data")
-        self.ib.reqMarketDataType(2)
-      tickers = await self.ib.reqTickersAsync(*qualified_contracts)
-
-      # Process tickers
-      result = self._process_tickers(tickers)
-
-      # Check if we got any greeks data (only for options contracts)
-      options_contracts = [ticker for ticker in result if ticker.secType == "OPT"]
-      has_greeks = False
-      if options_contracts:
-        has_greeks = any(ticker.greeks for ticker in options_contracts)
-
-      # Only restart if we have options contracts but no greeks data
-      if options_contracts and not has_greeks:
-        logger.warning("No greeks data for options contracts, restarting gateway...")
-        await self.send_command_to_ibc("RESTART")
-        await asyncio.sleep(30)
-        await self._connect()
-
-        # Second attempt
+      for attempt in range(2):
+        # Checked per attempt, the market may have opened during a restart
         if self._is_market_open():
+          logger.debug("Market is open, requesting live market data")
           self.ib.reqMarketDataType(1)
         else:
+          logger.debug("Market is closed, requesting delayed market data")
           self.ib.reqMarketDataType(2)
-        tickers = await self.ib.reqTickersAsync(*qualified_contracts)
+        tickers = await self._req_tickers(qualified_contracts)
+        result = await asyncio.to_thread(self._process_tickers, tickers)
 
-        # Process tickers again
-        result = self._process_tickers(tickers)
-        # Check if we got greeks data after restart (only for options)
+        # Options without any greeks usually mean a stale gateway session
         options_contracts = [ticker for ticker in result if ticker.secType == "OPT"]
-        has_greeks = False
-        if options_contracts:
-          has_greeks = any(ticker.greeks for ticker in options_contracts)
-        if options_contracts and not has_greeks:
+        if (
+          not require_greeks
+          or not options_contracts
+          or any(ticker.greeks for ticker in options_contracts)
+        ):
+          break
+        if attempt == 0:
+          logger.warning("No greeks data for options contracts, restarting gateway...")
+          await self.send_command_to_ibc("RESTART")
+          await asyncio.sleep(30)
+          await self._connect()
+        else:
           logger.warning("Still no greeks data after gateway restart")
 
-      result_dict = [ticker.dict() for ticker in result]
-
     except Exception as e:
       logger.error("Error getting tickers: {}", str(e))
       raise
     else:
-      return result_dict
+      return result
 
   async def get_and_filter_options(
       self,
@@ -146,7 +337,7 @@ class MarketDataClient(IBClient):
       underlying_con_id: int,
       filters: dict | None = None,
       criteria: dict | None = None,
-    ) -> list[dict]:
+    ) -> list[TickerData]:
     """Get and filter option chain based on market data criteria.
 
     Args:
@@ -165,75 +356,57 @@ class MarketDataClient(IBClient):
         - max_delta: Maximum delta value (float)
 
     Returns:
-      List of dictionaries containing filtered option details and market data
+      List of ticker data for the filtered options
 
     """
     try:
       await self._connect()  # Connect once for both operations
 
-      # Get options chain
-      options_chain = await self.contract_client.get_options_chain(
-        underlying_symbol,
-        underlying_sec_type,
-        underlying_con_id,
-        filters,
-      )
-      options_chain_df = pd.DataFrame(options_chain)
+      # Get options chain, warming the market calendar for get_tickers meanwhile
+      async with asyncio.TaskGroup() as tg:
+        chain_task = tg.create_task(
+          self.contract_client.get_options_chain(
+            underlying_symbol,
+            underlying_sec_type,
+            underlying_con_id,
+            filters=filters,
+          ),
+        )
+        tg.create_task(asyncio.to_thread(self._is_market_open))
+      options_chain = chain_task.result()
+      # Candidate chains (returned when the chain is ambiguous) have no con_id
+      con_ids = [option["con_id"] for option in options_chain if "con_id" in option]
 
       # Get market data for all options
-      market_data = await self.get_tickers(options_chain_df["conId"].tolist())
+      # Greeks are only needed to filter by delta
+      needs_greeks = bool(criteria and criteria.keys() & {"min_delta", "max_delta"})
+      market_data = await self.get_tickers(
+        con_ids,
+        require_greeks=needs_greeks,
+      )
 
       if not market_data:
         logger.warning("No market data available for options")
         return []
 
-      # Convert to DataFrame for filtering
-      market_data_df = pd.DataFrame(market_data)
-
-      # Apply criteria filters
-      filtered_data = market_data_df.copy()
-
-      # Apply delta range if specified
-      if criteria and ("min_delta" in criteria or "max_delta" in criteria):
-        # Filter out rows with missing greeks data first
-        filtered_data = filtered_data[
-          filtered_data["greeks"].apply(
-            lambda x: bool(x and x.get("delta") is not None),
-          )
-        ]
-
-        # Apply delta filters
-        filtered_data = filtered_data[
-          filtered_data["greeks"].apply(
-            lambda x: (
-              ("min_delta" not in criteria or
-                x["delta"] >= criteria["min_delta"]) and
-              ("max_delta" not in criteria or
-                x["delta"] <= criteria["max_delta"])
-            ),
-          )
+      # Apply delta range if specified, skipping options without greeks
+      filtered_data = market_data
+      if needs_greeks:
+        min_delta = criteria.get("min_delta", -math.inf)
+        max_delta = criteria.get("max_delta", math.inf)
+        filtered_data = [
+          ticker
+          for ticker in market_data
+          if (greeks := ticker.greeks)
+          and greeks.delta is not None
+          and min_delta <= greeks.delta <= max_delta
         ]
 
-      if filtered_data.empty:
+      if not filtered_data:
         logger.warning("No options found matching the criteria")
         return []
 
-      # Convert filtered DataFrame to list of Pydantic models
-      filtered_tickers = []
-      for _, row in filtered_data.iterrows():
-        ticker_data = TickerData(
-          contractId=row["contractId"],
-          symbol=row["symbol"],
-          secType=row["secType"],
-          last=row["last"] if pd.notna(row["last"]) else None,
-          bid=row["bid"] if pd.notna(row["bid"]) else None,
-          ask=row["ask"] if pd.notna(row["ask"]) else None,
-          greeks=row["greeks"],
-        )
-        filtered_tickers.append(ticker_data)
-
-      # Return as list of dictionaries
-      return [ticker.dict() for ticker in filtered_tickers]
+      return filtered_data
 
     except Exception as e:
       logger.error("Error filtering options: {}", str(e))
@@ -268,6 +441,20 @@ class MarketDataClient(IBClient):
     Raises:
       Exception: If contract qualification fails or historical data cannot be retrieved
     """
+    cache_key = (
+      symbol.upper(),
+      sec_type.upper(),
+      exchange.upper(),
+      currency.upper(),
+      duration,
+      bar_size,
+      what_to_show,
+      use_rth,
+    )
+    cached = self._historical_cache.get(cache_key)
+    if cached is not None:
+      return _copy_bars(cached)
+
     await self._connect()
     
     try:
@@ -313,19 +500,24 @@ class MarketDataClient(IBClient):
         
         logger.debug(f"Received {len(bars)} bars of historical data for {ib_contract.symbol}")
         
-        return [
-          BarData(
-            date=bar.date.isoformat() if hasattr(bar.date, 'isoformat') else str(bar.date),
-            open=float(bar.open) if bar.open is not None else None,
-            high=float(bar.high) if bar.high is not None else None,
-            low=float(bar.low) if bar.low is not None else None,
-            close=float(bar.close) if bar.close is not None else None,
-            volume=int(bar.volume) if bar.volume is not None else 0,
-            wap=float(bar.wap) if hasattr(bar, 'wap') and bar.wap is not None else None,
-            count=int(bar.barCount) if hasattr(bar, 'barCount') and bar.barCount is not None else None
+        # Bars are typed ib_async BarData, so skip pydantic validation
+        result = [
+          BarData.model_construct(
+            date=bar.date.isoformat(),
+            open=bar.open,
+            high=bar.high,
+            low=bar.low,
+            close=bar.close,
+            volume=int(bar.volume),
+            wap=bar.average,
+            count=bar.barCount,
           )
           for bar in bars
         ]
+        self._historical_cache.set(
+          cache_key, _copy_bars(result), ttl=_historical_ttl(bar_size),
+        )
+        return result
         
       except Exception as hist_error:
         error_msg = f"Failed to get historical data for {ib_contract.symbol} (type: {ib_contract.secType}): {str(hist_error)}"
@@ -336,6 +528,30 @@ class MarketDataClient(IBClient):
       logger.error(f"Historical data error for {symbol}: {str(e)}", exc_info=True)
       raise Exception(f"Historical data error: {str(e)}")
 
+  async def get_historical_data_many(
+      self,
+      requests: list[HistoricalDataRequest],
+    ) -> list[list[BarData]]:
+    """Get historical market data for several requests concurrently.
+
+    Args:
+      requests: Historical data requests, e.g. one per symbol.
+
+    Returns:
+      List of historical bar data per request, in the order of requests.
+
+    Raises:
+      Exception: If any of the requests fails
+
+    """
+    semaphore = asyncio.Semaphore(HISTORICAL_MAX_CONCURRENCY)
+
+    async def fetch(request: HistoricalDataRequest) -> list[BarData]:
+      async with semaphore:
+        return await self.get_historical_data(**request.model_dump())
+
+    return await asyncio.gather(*(fetch(request) for request in requests))
+
   async def get_market_data_snapshot(
       self,
       symbol: str,
@@ -359,89 +575,56 @@ class MarketDataClient(IBClient):
     await self._connect()
     
     try:
-      # Create contract
+      # Create and qualify contract
       if con_id:
-        ib_contract = Contract(conId=con_id)
+        qualify = self._qualify_con_ids([con_id])
       else:
         ib_contract = Contract()
         ib_contract.symbol = symbol
         ib_contract.secType = sec_type
         ib_contract.exchange = exchange
         ib_contract.currency = currency
-      
-      # Qualify contract
-      qualified_contracts = await self.ib.qualifyContractsAsync(ib_contract)
-      if not qualified_contracts:
+        qualify = self.ib.qualifyContractsAsync(ib_contract)
+
+      # Check the market calendar while the contract is being qualified
+      qualified_contracts, market_open = await asyncio.gather(
+        qualify,
+        asyncio.to_thread(self._is_market_open),
+      )
+      if not qualified_contracts or qualified_contracts[0] is None:
         raise Exception(f"Could not qualify contract: {symbol}")
       
       ib_contract = qualified_contracts[0]
       
-      # Request market data snapshot
+      # Request market data snapshot: live (type 1) while the market is open,
+      # otherwise frozen (type 2), i.e. the last prices recorded at the close
+      self.ib.reqMarketDataType(1 if market_open else 2)
       ticker = self.ib.reqMktData(ib_contract, '', True, False)
       
-      # Wait for data to be populated
-      await asyncio.sleep(0.5)
-      
-      # Extract data with NaN handling
-      last = None
-      bid = None
-      ask = None
-      bid_size = None
-      ask_size = None
-      volume = None
+      # Wait until all reported fields have arrived, bounded for contracts
+      # that never send some of them
+      loop = asyncio.get_running_loop()
+      deadline = loop.time() + SNAPSHOT_WAIT
+      while not _has_snapshot_fields(ticker):
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+          break
+        try:
+          await asyncio.wait_for(ticker.updateEvent, remaining)
+        except TimeoutError:
+          break
       
+      # Extract data, dropping NaN, infinite and missing (-1) values
       if ticker:
-        # Check last price
-        if ticker.last and str(ticker.last).lower() not in ['nan', 'inf', '-inf']:
-          try:
-            last = float(ticker.last)
-          except (ValueError, TypeError):
-            pass
-        
-        # Check bid
-        if ticker.bid and str(ticker.bid).lower() not in ['nan', 'inf', '-inf']:
-          try:
-            bid = float(ticker.bid)
-          except (ValueError, TypeError):
-            pass
-        
-        # Check ask
-        if ticker.ask and str(ticker.ask).lower() not in ['nan', 'inf', '-inf']:
-          try:
-            ask = float(ticker.ask)
-          except (ValueError, TypeError):
-            pass
-        
-        # Check bid size
-        if hasattr(ticker, 'bidSize') and ticker.bidSize:
-          try:
-            bid_size = int(ticker.bidSize)
-          except (ValueError, TypeError):
-            pass
-        
-        # Check ask size
-        if hasattr(ticker, 'askSize') and ticker.askSize:
-          try:
-            ask_size = int(ticker.askSize)
-          except (ValueError, TypeError):
-            pass
-        
-        # Check volume
-        if hasattr(ticker, 'volume') and ticker.volume:
-          try:
-            volume = int(ticker.volume)
-          except (ValueError, TypeError):
-            pass
-        
         return TickData(
           symbol=symbol,
           contract_id=ib_contract.conId if hasattr(ib_contract, 'conId') else None,
-          last=last,
-          bid=bid,
-          ask=ask,
-          bid_size=bid_size,
-          ask_size=ask_size,
-          volume=volume
+          last=valid_value(ticker.last),
+          bid=valid_value(ticker.bid),
+          ask=valid_value(ticker.ask),
+          bid_size=valid_value(ticker.bidSize, int),
+          ask_size=valid_value(ticker.askSize, int),
+          volume=valid_value(ticker.volume, int),
         )
       
       return None
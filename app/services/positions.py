@@ -1,10 +1,19 @@
 """Position operations."""
-import pandas as pd
-from ib_async import util
+from ib_async.contract import Contract
 
 from .client import IBClient
 from app.core.setup_logging import logger
 
+def _multiplier(contract: Contract) -> float:
+  """Return the contract multiplier, or 1 if it is missing or invalid."""
+  if contract.multiplier in (None, "", "0"):
+    return 1.0
+  try:
+    return float(contract.multiplier)
+  except (ValueError, TypeError):
+    logger.warning("Invalid multiplier {}, using 1", contract.localSymbol)
+    return 1.0
+
 class PositionClient(IBClient):
   """Position operations.
 
@@ -17,27 +26,18 @@ class PositionClient(IBClient):
     """Get account positions."""
     try:
       await self._connect()
-      positions = util.df(self.ib.positions())
-      if positions.empty:
-        return []
-
-      # Safely handle multiplier conversion with error checking
-      def safe_cost_calculation(row: pd.Series) -> float:
-        try:
-          multiplier = float(row["contract"].multiplier or 1)
-          return row["avgCost"] / multiplier
-        except (ValueError, TypeError, AttributeError):
-          logger.warning(f"Invalid multiplier {row['contract'].localSymbol}, using 1")
-          return row["avgCost"]
-
-      positions["contractId"] = positions["contract"].apply(lambda x: x.conId)
-      positions["avgCost"] = positions.apply(safe_cost_calculation, axis=1)
-      positions["contract"] = positions["contract"].apply(lambda x: x.localSymbol)
-
-      # Remove sensitive information
-      del positions["account"]
+      # The account is left out to avoid exposing sensitive information
+      positions = [
+        {
+          "contract": pos.contract.localSymbol,
+          "position": pos.position,
+          "avgCost": pos.avgCost / _multiplier(pos.contract),
+          "contractId": pos.contract.conId,
+        }
+        for pos in self.ib.positions()
+      ]
     except Exception as e:
       logger.error("Error getting positions: {}", str(e))
       raise
     else:
-      return positions.to_dict(orient="records")
+      return positions
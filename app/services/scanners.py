@@ -1,10 +1,80 @@
 """Scanner operations."""
+import asyncio
+import io
+from functools import lru_cache
+from typing import ClassVar
+
 from defusedxml import ElementTree
 from ib_async.objects import ScannerSubscription, TagValue
 
 from .client import IBClient
 from app.core.setup_logging import logger
 from app.models.scanner import ScannerRequest
+from app.util.ttl_cache import TTLCache
+
+# Scanner parameters rarely change, refetch them hourly
+SCANNER_PARAMS_TTL = 3600
+
+# (parent tag, child tag) pairs of the scanner parameters XML holding codes
+SCANNER_CODE_PATHS = {
+  ("Instrument", "type"): "instrument",
+  ("Location", "locationCode"): "location",
+  ("AbstractField", "code"): "filter",
+}
+
+
+def _extract_scanner_codes(xml_parameters: str) -> dict[str, list[str]]:
+  """Collect the scanner code lists from the scanner parameters XML.
+
+  The XML is streamed and each element is cleared once handled, so the full
+  document tree is never held in memory.
+
+  Args:
+    xml_parameters: Scanner parameters XML as returned by IB.
+
+  Returns:
+    Dictionary of code lists keyed by "instrument", "location", "filter"
+    and "scan".
+
+  """
+  codes: dict[str, list[str]] = {
+    "instrument": [],
+    "location": [],
+    "filter": [],
+    "scan": [],
+  }
+  # Tags of the currently open elements, the parent of each element is last
+  open_tags: list[str] = []
+  for event, elem in ElementTree.iterparse(
+    io.StringIO(xml_parameters),
+    events=("start", "end"),
+  ):
+    if event == "start":
+      open_tags.append(elem.tag)
+      continue
+
+    open_tags.pop()
+    parent_tag = open_tags[-1] if open_tags else None
+    key = SCANNER_CODE_PATHS.get((parent_tag, elem.tag))
+    if key is None and elem.tag == "scanCode":
+      key = "scan"
+    if key is not None:
+      codes[key].append(elem.text)
+    elem.clear()
+  return codes
+
+
+@lru_cache(maxsize=128)
+def _tags_to_tagvalues(tags: tuple[str, ...]) -> tuple[TagValue, ...]:
+  """Convert 'parameter=value' filter codes to TagValues.
+
+  Only the first '=' separates parameter and value, so values may contain '='.
+  """
+  return tuple(
+    TagValue(parameter, value)
+    for parameter, _, value in (tag.partition("=") for tag in tags)
+  )
+
 
 class ScannerClient(IBClient):
   """Scanner operations.
@@ -16,57 +86,74 @@ class ScannerClient(IBClient):
     - get_scanner_results: get scanner results
   """
 
+  # Shared across instances, the lock prevents concurrent refetches
+  _scanner_codes_cache: ClassVar[TTLCache] = TTLCache(maxsize=1, ttl=SCANNER_PARAMS_TTL)
+  _scanner_codes_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+
+  async def _get_scanner_codes(self) -> dict[str, list[str]]:
+    """Get the scanner codes, fetching the scanner parameters when not cached.
+
+    The scanner parameters XML is large and rarely changes, so it is requested
+    and parsed at most once per SCANNER_PARAMS_TTL seconds.
+
+    Returns:
+      Dictionary of code lists keyed by "instrument", "location", "filter"
+      and "scan".
+
+    """
+    codes = self._scanner_codes_cache.get("codes")
+    if codes is not None:
+      return codes
+
+    async with self._scanner_codes_lock:
+      # Another caller may have fetched the codes while we waited
+      codes = self._scanner_codes_cache.get("codes")
+      if codes is None:
+        await self._connect()
+        xml_parameters = await self.ib.reqScannerParametersAsync()
+        codes = _extract_scanner_codes(xml_parameters)
+        self._scanner_codes_cache.set("codes", codes)
+    return codes
+
   async def get_scanner_instrument_codes(self) -> list[str]:
     """Get scanner instrument codes."""
     try:
-      await self._connect()
-      xml_parameters = await self.ib.reqScannerParametersAsync()
-      tree = ElementTree.fromstring(xml_parameters)
-      tags = [elem.text for elem in tree.findall(".//Instrument/type")]
+      codes = await self._get_scanner_codes()
     except Exception as e:
       logger.error("Error getting scanner instrument codes: {}", str(e))
       raise
     else:
-      return tags
+      return list(codes["instrument"])
 
   async def get_scanner_location_codes(self) -> list[str]:
     """Get scanner location codes."""
     try:
-      await self._connect()
-      xml_parameters = await self.ib.reqScannerParametersAsync()
-      tree = ElementTree.fromstring(xml_parameters)
-      tags = [elem.text for elem in tree.findall(".//Location/locationCode")]
+      codes = await self._get_scanner_codes()
     except Exception as e:
       logger.error("Error getting scanner location codes: {}", str(e))
       raise
     else:
-      return tags
+      return list(codes["location"])
 
   async def get_scanner_filter_codes(self) -> list[str]:
     """Get scanner filter codes."""
     try:
-      await self._connect()
-      xml_parameters = await self.ib.reqScannerParametersAsync()
-      tree = ElementTree.fromstring(xml_parameters)
-      tags = [elem.text for elem in tree.findall(".//AbstractField/code")]
+      codes = await self._get_scanner_codes()
     except Exception as e:
       logger.error("Error getting scanner filter codes: {}", str(e))
       raise
     else:
-      return tags
+      return list(codes["filter"])
 
   async def get_scanner_scan_codes(self) -> list[str]:
     """Get scanner scan codes."""
     try:
-      await self._connect()
-      xml_parameters = await self.ib.reqScannerParametersAsync()
-      tree = ElementTree.fromstring(xml_parameters)
-      tags = [elem.text for elem in tree.findall(".//scanCode")]
+      codes = await self._get_scanner_codes()
     except Exception as e:
       logger.error("Error getting scanner filter codes: {}", str(e))
       raise
     else:
-      return tags
+      return list(codes["scan"])
 
   async def get_scanner_results(self, scanner_request: ScannerRequest) -> list[str]:
     """Get scanner results.
@@ -80,7 +167,7 @@ class ScannerClient(IBClient):
 
     """
     try:
-      cleaned_tags = [TagValue(tag.split("=")[0], tag.split("=")[1]) for tag in scanner_request.get_filter_codes()] #noqa: E501
+      cleaned_tags = list(_tags_to_tagvalues(tuple(scanner_request.get_filter_codes())))
 
       await self._connect()
       sub_object = ScannerSubscription(
@@ -89,9 +176,8 @@ class ScannerClient(IBClient):
         locationCode=scanner_request.location_code,
         scanCode=scanner_request.scan_code,
       )
-      active_sub = self.ib.reqScannerSubscription(sub_object, [], cleaned_tags)
+      # One-shot request, subscribes and cancels internally once data arrives
       scanner_data = await self.ib.reqScannerDataAsync(sub_object, [], cleaned_tags)
-      self.ib.cancelScannerSubscription(active_sub)
 
       symbols = [row.contractDetails.contract.symbol for row in scanner_data]
     except Exception as e:
@@ -1,58 +1,144 @@
 """Trading operations service."""
 import asyncio
-from ib_async import Contract as IBContract, Order as IBOrder, Stock, Option, Future, Forex
+from collections.abc import Callable
+from typing import ClassVar
+
+from ib_async import (
+  Contract as IBContract, Order as IBOrder, Trade, Stock, Option, Future, Forex
+)
 from app.services.client import IBClient
 from app.core.setup_logging import logger
+from app.util.ttl_cache import TTLCache
 from app.models import (
   ContractRequest, OrderRequest, OrderResponse, OpenOrder, SecType
 )
 
+# Upper bound on how long place_order waits for IB to acknowledge an order
+ORDER_ACK_TIMEOUT = 2.0
+
+# Order statuses reported before IB has acknowledged the order
+UNACKNOWLEDGED_STATUSES = ("", "PendingSubmit")
+
 
 class TradingClient(IBClient):
   """Trading operations."""
 
+  # Shared across instances, reset on disconnect via clear_caches()
+  _qualified_contracts_cache = TTLCache(maxsize=1024, ttl=3600)
+  # ib_async keeps open trades up to date once synced for a connection
+  _open_orders_synced: ClassVar[bool] = False
+
+  def __init__(self) -> None:
+    """Initialize the TradingClient."""
+    super().__init__()
+    # Open trades by order ID, refreshed from openTrades() on a lookup miss
+    self._trades_by_order_id: dict[int, Trade] = {}
+
+  @classmethod
+  def clear_caches(cls) -> None:
+    """Drop all cached qualified contracts and resync open orders on next use."""
+    cls._qualified_contracts_cache.clear()
+    TradingClient._open_orders_synced = False
+
+  async def _qualify_contract(self, contract: ContractRequest) -> IBContract | None:
+    """Qualify a contract request, reusing recently qualified contracts.
+
+    Args:
+      contract: Contract to qualify
+
+    Returns:
+      Qualified IB contract, or None if it could not be qualified
+    """
+    cache_key = (
+      contract.sec_type,
+      contract.symbol,
+      contract.exchange,
+      contract.currency,
+      contract.local_symbol,
+      contract.con_id,
+      contract.expiry,
+      contract.strike,
+      contract.right,
+      contract.last_trade_date,
+      contract.multiplier,
+    )
+    qualified = self._qualified_contracts_cache.get(cache_key)
+    if qualified is not None:
+      return qualified
+
+    qualified_contracts = await self.ib.qualifyContractsAsync(
+      self._contract_to_ib(contract),
+    )
+    if not qualified_contracts or qualified_contracts[0] is None:
+      return None
+    qualified = qualified_contracts[0]
+    self._qualified_contracts_cache.set(cache_key, qualified)
+    return qualified
+
+  def _find_open_trade(self, order_id: int) -> Trade | None:
+    """Find the open trade for an order ID.
+
+    Known trades are looked up directly; the index is rebuilt from the open
+    trades only when the order is unknown or its trade has finished.
+    """
+    trade = self._trades_by_order_id.get(order_id)
+    if trade is None or trade.isDone():
+      self._trades_by_order_id = {
+        trade.order.orderId: trade for trade in self.ib.openTrades()
+      }
+      trade = self._trades_by_order_id.get(order_id)
+    return trade
+
+  # Contract builders by security type, other types use _generic_contract
+  _CONTRACT_BUILDERS: ClassVar[
+    dict[SecType, Callable[[ContractRequest], IBContract]]
+  ] = {
+    SecType.STOCK: lambda c: Stock(
+      symbol=c.symbol,
+      exchange=c.exchange,
+      currency=c.currency
+    ),
+    SecType.OPTION: lambda c: Option(
+      symbol=c.symbol,
+      lastTradeDateOrContractMonth=c.expiry or '',
+      strike=float(c.strike or 0),
+      right=c.right or 'C',
+      exchange=c.exchange,
+      currency=c.currency
+    ),
+    SecType.FUTURE: lambda c: Future(
+      symbol=c.symbol,
+      lastTradeDateOrContractMonth=c.last_trade_date or '',
+      exchange=c.exchange,
+      currency=c.currency
+    ),
+    SecType.FOREX: lambda c: Forex(
+      pair=c.symbol,
+      exchange=c.exchange,
+      currency=c.currency
+    ),
+  }
+
+  @staticmethod
+  def _generic_contract(contract: ContractRequest) -> IBContract:
+    """Build a generic IB Contract for security types without a builder."""
+    ib_contract = IBContract()
+    ib_contract.symbol = contract.symbol
+    ib_contract.secType = contract.sec_type.value
+    ib_contract.exchange = contract.exchange
+    ib_contract.currency = contract.currency
+    if contract.local_symbol:
+      ib_contract.localSymbol = contract.local_symbol
+    if contract.con_id:
+      ib_contract.conId = contract.con_id
+    return ib_contract
+
   def _contract_to_ib(self, contract: ContractRequest) -> IBContract:
     """Convert ContractRequest to IB Contract."""
-    if contract.sec_type == SecType.STOCK:
-      return Stock(
-        symbol=contract.symbol,
-        exchange=contract.exchange,
-        currency=contract.currency
-      )
-    elif contract.sec_type == SecType.OPTION:
-      return Option(
-        symbol=contract.symbol,
-        lastTradeDateOrContractMonth=contract.expiry or '',
-        strike=float(contract.strike or 0),
-        right=contract.right or 'C',
-        exchange=contract.exchange,
-        currency=contract.currency
-      )
-    elif contract.sec_type == SecType.FUTURE:
-      return Future(
-        symbol=contract.symbol,
-        lastTradeDateOrContractMonth=contract.last_trade_date or '',
-        exchange=contract.exchange,
-        currency=contract.currency
-      )
-    elif contract.sec_type == SecType.FOREX:
-      return Forex(
-        pair=contract.symbol,
-        exchange=contract.exchange,
-        currency=contract.currency
-      )
-    else:
-      # Fallback to generic contract
-      ib_contract = IBContract()
-      ib_contract.symbol = contract.symbol
-      ib_contract.secType = contract.sec_type.value
-      ib_contract.exchange = contract.exchange
-      ib_contract.currency = contract.currency
-      if contract.local_symbol:
-        ib_contract.localSymbol = contract.local_symbol
-      if contract.con_id:
-        ib_contract.conId = contract.con_id
-      return ib_contract
+    builder = self._CONTRACT_BUILDERS.get(contract.sec_type)
+    if builder is None:
+      return self._generic_contract(contract)
+    return builder(contract)
 
   def _order_to_ib(self, order: OrderRequest) -> IBOrder:
     """Convert OrderRequest to IB Order."""
@@ -92,21 +178,27 @@ class TradingClient(IBClient):
     await self._connect()
     
     try:
-      ib_contract = self._contract_to_ib(contract)
       ib_order = self._order_to_ib(order)
       
       # Qualify contract if needed
-      qualified_contracts = await self.ib.qualifyContractsAsync(ib_contract)
-      if not qualified_contracts:
+      ib_contract = await self._qualify_contract(contract)
+      if ib_contract is None:
         raise Exception(f"Could not qualify contract: {contract.symbol}")
       
-      ib_contract = qualified_contracts[0]
-      
       # Place order
       trade = self.ib.placeOrder(ib_contract, ib_order)
-      await asyncio.sleep(0.5)  # Wait for order to be acknowledged
+      self._trades_by_order_id[trade.order.orderId] = trade
+      # Wait for the order to be acknowledged, bounded for a slow gateway
+      if trade.orderStatus.status in UNACKNOWLEDGED_STATUSES:
+        try:
+          await asyncio.wait_for(trade.statusEvent, ORDER_ACK_TIMEOUT)
+        except TimeoutError:
+          logger.warning(
+            "Order {} not acknowledged within {}s",
+            trade.order.orderId, ORDER_ACK_TIMEOUT,
+          )
       
-      logger.info(f"Order placed: {trade.order.orderId} for {contract.symbol}")
+      logger.info("Order placed: {} for {}", trade.order.orderId, contract.symbol)
       
       return OrderResponse(
         order_id=trade.order.orderId,
@@ -116,11 +208,14 @@ class TradingClient(IBClient):
         quantity=float(order.total_quantity),
         filled=float(trade.orderStatus.filled),
         remaining=float(trade.orderStatus.remaining),
-        avg_fill_price=float(trade.orderStatus.avgFillPrice) if trade.orderStatus.avgFillPrice else None
+        avg_fill_price=(
+          float(trade.orderStatus.avgFillPrice)
+          if trade.orderStatus.avgFillPrice else None
+        )
       )
       
     except Exception as e:
-      logger.error(f"Failed to place order: {e}")
+      logger.error("Failed to place order: {}", e)
       raise Exception(f"Order placement error: {e}")
 
   async def cancel_order(self, order_id: int) -> bool:
@@ -135,29 +230,40 @@ class TradingClient(IBClient):
     await self._connect()
     
     try:
-      # Get all open trades to find the order
-      open_trades = self.ib.openTrades()
-      
-      # Find matching order
-      target_order = None
-      for trade in open_trades:
-        if trade.order.orderId == order_id:
-          target_order = trade.order
-          break
-      
-      if target_order is None:
-        logger.error(f"Order with ID {order_id} not found in open trades")
+      trade = self._find_open_trade(order_id)
+      if trade is None:
+        logger.error("Order with ID {} not found in open trades", order_id)
         raise Exception(f"Order {order_id} not found")
       
       # Cancel the order
-      self.ib.cancelOrder(target_order)
-      logger.info(f"Order cancelled: {order_id}")
+      self.ib.cancelOrder(trade.order)
+      logger.info("Order cancelled: {}", order_id)
       return True
       
     except Exception as e:
-      logger.error(f"Failed to cancel order {order_id}: {e}")
+      logger.error("Failed to cancel order {}: {}", order_id, e)
       raise Exception(f"Order cancellation error: {e}")
 
+  @staticmethod
+  def _trade_to_open_order(trade: Trade) -> OpenOrder:
+    """Convert an IB trade to an OpenOrder."""
+    contract, order, status = trade.contract, trade.order, trade.orderStatus
+    # Fields come from typed IB objects, so skip pydantic validation
+    return OpenOrder.model_construct(
+      order_id=order.orderId,
+      symbol=contract.symbol,
+      sec_type=contract.secType,
+      action=order.action,
+      quantity=float(order.totalQuantity),
+      order_type=order.orderType,
+      status=status.status,
+      limit_price=float(order.lmtPrice) if order.lmtPrice else None,
+      aux_price=float(order.auxPrice) if order.auxPrice else None,
+      filled=float(status.filled),
+      remaining=float(status.remaining),
+      avg_fill_price=float(status.avgFillPrice) if status.avgFillPrice else None
+    )
+
   async def get_open_orders(self) -> list[OpenOrder]:
     """Get all open orders.
     
@@ -167,27 +273,14 @@ class TradingClient(IBClient):
     await self._connect()
     
     try:
-      await self.ib.reqOpenOrdersAsync()
+      if not self._open_orders_synced:
+        await self.ib.reqOpenOrdersAsync()
+        TradingClient._open_orders_synced = True
       trades = self.ib.openTrades()
       
-      orders_data = []
-      for trade in trades:
-        orders_data.append(OpenOrder(
-          order_id=trade.order.orderId,
-          symbol=trade.contract.symbol,
-          sec_type=trade.contract.secType,
-          action=trade.order.action,
-          quantity=float(trade.order.totalQuantity),
-          order_type=trade.order.orderType,
-          status=trade.orderStatus.status,
-          limit_price=float(trade.order.lmtPrice) if trade.order.lmtPrice else None,
-          aux_price=float(trade.order.auxPrice) if trade.order.auxPrice else None,
-          filled=float(trade.orderStatus.filled),
-          remaining=float(trade.orderStatus.remaining),
-          avg_fill_price=float(trade.orderStatus.avgFillPrice) if trade.orderStatus.avgFillPrice else None
-        ))
+      orders_data = [self._trade_to_open_order(trade) for trade in trades]
       
       return orders_data
     except Exception as e:
-      logger.error(f"Failed to get open orders: {e}")
+      logger.error("Failed to get open orders: {}", e)
       raise Exception(f"Open orders error: {e}")
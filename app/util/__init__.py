@@ -1,12 +1,20 @@
 """Utility modules."""
+from .batching import gather_in_chunks
 from .convert_camel_to_snake_case import (
   camel_to_snake,
   convert_df_columns_to_snake_case,
   obj_to_dict_snake_case,
 )
+from .file_cache import FileCache
+from .numbers import valid_value
+from .ttl_cache import TTLCache
 
 __all__ = [
+  "FileCache",
+  "TTLCache",
   "camel_to_snake",
   "convert_df_columns_to_snake_case",
+  "gather_in_chunks",
   "obj_to_dict_snake_case",
+  "valid_value",
 ]
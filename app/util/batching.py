@@ -0,0 +1,52 @@
+"""Async batching utility functions."""
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import Any
+
+
+async def gather_in_chunks(
+  func: Callable[..., Awaitable[list[Any]]],
+  items: Sequence[Any],
+  chunk_size: int,
+  max_concurrency: int,
+  timeout: float | None = None,
+  key: Callable[[Any], Hashable] | None = None,
+) -> list[Any]:
+  """Call func on fixed-size chunks of items concurrently and flatten the results.
+
+  Args:
+    func: Coroutine function called with the items of one chunk as arguments,
+      returning a list of results.
+    items: Items to split into chunks.
+    chunk_size: Maximum number of items passed to a single call.
+    max_concurrency: Maximum number of calls in flight at once.
+    timeout: Timeout in seconds for each call, or None to wait indefinitely.
+    key: Optional function sharding items before chunking, so that a chunk
+      never mixes items with different keys.
+
+  Returns:
+    Concatenated results of all calls, in the order of the input items, or
+    grouped by shard in order of first appearance when key is given.
+
+  """
+  semaphore = asyncio.Semaphore(max_concurrency)
+
+  async def run_chunk(chunk: Sequence[Any]) -> list[Any]:
+    async with semaphore:
+      return await asyncio.wait_for(func(*chunk), timeout=timeout)
+
+  if key is None:
+    shards = [items]
+  else:
+    grouped: dict[Hashable, list[Any]] = {}
+    for item in items:
+      grouped.setdefault(key(item), []).append(item)
+    shards = list(grouped.values())
+
+  chunks = [
+    shard[i:i + chunk_size]
+    for shard in shards
+    for i in range(0, len(shard), chunk_size)
+  ]
+  results = await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+  return [item for result in results for item in result]
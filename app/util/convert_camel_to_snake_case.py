@@ -1,10 +1,12 @@
 """Snake case conversion utility functions."""
-import re
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
+if TYPE_CHECKING:
+  import pandas as pd
 
 
+@lru_cache(maxsize=1024)
 def camel_to_snake(name: str) -> str:
   """Convert camelCase string to snake_case.
 
@@ -23,16 +25,24 @@ def camel_to_snake(name: str) -> str:
     'con_id'
 
   """
-  # Handle the pattern where an uppercase letter follows a lowercase letter
-  # Insert underscore before it and lowercase it
-  s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-  # Handle the pattern where an uppercase letter follows another uppercase
-  # followed by lowercase (e.g., XMLHttpRequest)
-  s2 = re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1)
-  return s2.lower()
-
-
-def convert_df_columns_to_snake_case(df: pd.DataFrame) -> pd.DataFrame:
+  chars = []
+  last = len(name) - 1
+  for i, char in enumerate(name):
+    if i > 0 and "A" <= char <= "Z":
+      prev = name[i - 1]
+      # Split after a lowercase letter or digit (e.g. "conId"), or before the
+      # last capital of an acronym followed by a word (e.g. "XMLHttp")
+      if (
+        "a" <= prev <= "z"
+        or "0" <= prev <= "9"
+        or (i < last and "a" <= name[i + 1] <= "z")
+      ):
+        chars.append("_")
+    chars.append(char)
+  return "".join(chars).lower()
+
+
+def convert_df_columns_to_snake_case(df: "pd.DataFrame") -> "pd.DataFrame":
   """Convert all DataFrame column names from camelCase to snake_case.
 
   Args:
@@ -42,8 +52,9 @@ def convert_df_columns_to_snake_case(df: pd.DataFrame) -> pd.DataFrame:
     DataFrame with snake_case column names.
 
   """
-  df = df.copy()
-  df.columns = [camel_to_snake(col) for col in df.columns]
+  # A shallow copy keeps the caller's frame intact without copying the data
+  df = df.copy(deep=False)
+  df.columns = df.columns.map(camel_to_snake)
   return df
 
 
@@ -57,8 +68,4 @@ def obj_to_dict_snake_case(obj: Any) -> dict[str, Any]:
     Dictionary with snake_case keys from the object's public attributes.
 
   """
-  return {
-    camel_to_snake(k): v
-    for k, v in obj.__dict__.items()
-    if not k.startswith("_")
-  }
+  return {camel_to_snake(k): v for k, v in vars(obj).items() if k[:1] != "_"}
@@ -0,0 +1,77 @@
+"""On-disk pickle cache utility."""
+import asyncio
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any
+
+from app.core.setup_logging import logger
+
+
+class FileCache:
+  """Pickle cache storing one file per key in a directory.
+
+  Disk I/O runs in a worker thread so the event loop is not blocked. Files
+  older than max_age are evicted the first time the cache is accessed.
+  """
+
+  def __init__(self, directory: str | Path, max_age: float) -> None:
+    """Initialize the cache.
+
+    Args:
+      directory: Directory holding the cache files, created on first write.
+      max_age: Age in seconds after which cache files are evicted.
+
+    """
+    self.directory = Path(directory)
+    self.max_age = max_age
+    self._evicted = False
+
+  async def get(self, key: str) -> Any:  # noqa: ANN401
+    """Return the cached value for key, or None if it is not cached."""
+    return await asyncio.to_thread(self._read, key)
+
+  async def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+    """Store value under key, replacing the cache file atomically."""
+    await asyncio.to_thread(self._write, key, value)
+
+  def _path(self, key: str) -> Path:
+    return self.directory / f"{key}.pkl"
+
+  def _read(self, key: str) -> Any:  # noqa: ANN401
+    self._evict_expired()
+    try:
+      with self._path(key).open("rb") as f:
+        return pickle.load(f)
+    except FileNotFoundError:
+      return None
+    except (OSError, EOFError, pickle.UnpicklingError) as e:
+      logger.warning("Error reading cache file for {}: {}", key, e)
+      return None
+
+  def _write(self, key: str, value: Any) -> None:  # noqa: ANN401
+    self._evict_expired()
+    path = self._path(key)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+      self.directory.mkdir(parents=True, exist_ok=True)
+      with tmp_path.open("wb") as f:
+        pickle.dump(value, f)
+      tmp_path.replace(path)
+    except OSError as e:
+      logger.warning("Error writing cache file for {}: {}", key, e)
+      tmp_path.unlink(missing_ok=True)
+
+  def _evict_expired(self) -> None:
+    if self._evicted:
+      return
+    self._evicted = True
+
+    cutoff = time.time() - self.max_age
+    for path in self.directory.glob("*.pkl"):
+      try:
+        if path.stat().st_mtime < cutoff:
+          path.unlink()
+      except OSError as e:
+        logger.warning("Error evicting cache file {}: {}", path, e)
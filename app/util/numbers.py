@@ -0,0 +1,40 @@
+"""Numeric sanitizing utility functions."""
+import math
+
+
+def valid_value(
+  value: object,
+  value_type: type[float] | type[int] = float,
+) -> float | int | None:
+  """Convert an IB market data value, dropping missing and sentinel values.
+
+  IB reports unavailable prices and sizes as NaN, infinity or -1.
+
+  Args:
+    value: Value to convert.
+    value_type: Type to convert the value to, float or int.
+
+  Returns:
+    The converted value, or None if it is missing, not finite, -1, or
+    cannot be converted.
+
+  Examples:
+    >>> valid_value(1.5)
+    1.5
+    >>> valid_value(float("nan")) is None
+    True
+    >>> valid_value(-1, int) is None
+    True
+
+  """
+  if value is None:
+    return None
+  try:
+    converted = value_type(value)
+  except (ValueError, TypeError, OverflowError):
+    return None
+  if value_type is float and not math.isfinite(converted):
+    return None
+  if converted == -1:
+    return None
+  return converted
@@ -0,0 +1,54 @@
+"""Time-to-live cache utility."""
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+  """Bounded in-memory cache whose entries expire after a time-to-live.
+
+  Once maxsize is reached the least recently used entry is evicted.
+  """
+
+  def __init__(self, maxsize: int, ttl: float) -> None:
+    """Initialize the cache.
+
+    Args:
+      maxsize: Maximum number of entries kept in the cache.
+      ttl: Default time-to-live of an entry in seconds.
+
+    """
+    self.maxsize = maxsize
+    self.ttl = ttl
+    self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+  def get(self, key: Hashable, default: Any = None) -> Any:  # noqa: ANN401
+    """Return the cached value for key, or default if missing or expired."""
+    entry = self._data.get(key)
+    if entry is None:
+      return default
+
+    expires_at, value = entry
+    if expires_at <= time.monotonic():
+      del self._data[key]
+      return default
+
+    self._data.move_to_end(key)
+    return value
+
+  def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:  # noqa: ANN401
+    """Store value under key, optionally overriding the default ttl."""
+    expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+    self._data[key] = (expires_at, value)
+    self._data.move_to_end(key)
+    while len(self._data) > self.maxsize:
+      self._data.popitem(last=False)
+
+  def clear(self) -> None:
+    """Remove all entries."""
+    self._data.clear()
+
+  def __len__(self) -> int:
+    """Return the number of stored entries, including expired ones."""
+    return len(self._data)
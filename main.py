@@ -4,7 +4,6 @@ import argparse
 import os
 from pathlib import Path
 
-import uvicorn
 from dotenv import load_dotenv
 
 from app.core.config import init_config
@@ -56,9 +55,9 @@ def load_environment():
 
 def main() -> None:
   """Run the app."""
-  # Load environment variables first
-  env = load_environment()
+  # Parse arguments first so --help works without the environment or the app
   args = parse_args()
+  env = load_environment()
 
   # Initialize global config with environment variables and CLI parameters
   config = init_config(
@@ -70,6 +69,9 @@ def main() -> None:
     ib_gateway_tradingmode=args.ib_gateway_tradingmode,
   )
 
+  # Heavy imports are deferred until the configuration is valid
+  import uvicorn  # noqa: PLC0415
+
   from app.main import app # noqa: PLC0415
   app.state.port = config.application_port
   uvicorn.run(
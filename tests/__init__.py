@@ -0,0 +1,6 @@
+"""Tests for the IBKR MCP server."""
+import os
+
+# The config requires gateway credentials, none are used by the tests
+os.environ.setdefault("IB_GATEWAY_USERNAME", "test")
+os.environ.setdefault("IB_GATEWAY_PASSWORD", "test")
@@ -0,0 +1 @@
+"""Tests for the IB service clients."""
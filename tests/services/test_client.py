@@ -0,0 +1,190 @@
+"""Tests for the base IB client."""
+import asyncio
+import unittest
+from unittest import mock
+
+from eventkit import Event
+
+from app.core.config import get_config
+from app.services.client import CLIENT_ID_IN_USE, IBClient
+from app.services.contracts import ContractClient
+from app.services.market_data import MarketDataClient
+from app.services.trading import TradingClient
+
+
+class ClearCachesTest(unittest.TestCase):
+  """Service caches are dropped when the shared connection drops."""
+
+  def test_disconnect_clears_all_service_caches(self) -> None:
+    """Every client class with caches is cleared on disconnectedEvent."""
+    client = IBClient()
+    ContractClient._contract_details_cache.set("key", ["details"])
+    ContractClient._option_params_cache.set("key", ["chain"])
+    MarketDataClient._qualified_contracts.set(1, "contract")
+    MarketDataClient._historical_cache.set("key", ["bar"])
+    TradingClient._qualified_contracts_cache.set("key", "contract")
+    TradingClient._open_orders_synced = True
+
+    client.ib.disconnectedEvent.emit()
+
+    for cache in (
+      ContractClient._contract_details_cache,
+      ContractClient._option_params_cache,
+      MarketDataClient._qualified_contracts,
+      MarketDataClient._historical_cache,
+      TradingClient._qualified_contracts_cache,
+    ):
+      self.assertEqual(len(cache), 0)
+    self.assertFalse(TradingClient._open_orders_synced)
+
+
+class ConnectTest(unittest.IsolatedAsyncioTestCase):
+  """Connection retries with backoff, deadline and client ID renewal."""
+
+  def setUp(self) -> None:
+    """Create a client whose IB connection attempts are answered by a mock."""
+    self.client = IBClient()
+    self.client.ib = mock.Mock()
+    self.client.ib.isConnected.return_value = False
+    self.client.ib.errorEvent = Event("errorEvent")
+    self.client.ib.connectAsync = mock.AsyncMock(
+      side_effect=ConnectionRefusedError("refused"),
+    )
+    IBClient._connect_failed_at = None
+    self.addCleanup(setattr, IBClient, "_connect_failed_at", None)
+
+    # Backoff sleeps advance a fake monotonic clock instead of waiting
+    self.now = 0.0
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay: float) -> None:
+      self.now += delay
+      await real_sleep(0)
+
+    self.sleep = mock.AsyncMock(side_effect=sleep)
+    for target, patch in (
+      ("app.services.client.asyncio.sleep", self.sleep),
+      ("app.services.client.time.monotonic", lambda: self.now),
+    ):
+      patcher = mock.patch(target, patch)
+      patcher.start()
+      self.addCleanup(patcher.stop)
+
+  async def test_retries_with_backoff_until_connected(self) -> None:
+    """Failed attempts are retried after exponentially growing delays."""
+    self.client.ib.connectAsync.side_effect = [
+      ConnectionRefusedError("refused"),
+      ConnectionRefusedError("refused"),
+      None,
+    ]
+    await self.client._connect()
+    self.assertEqual(self.client.ib.connectAsync.await_count, 3)
+
+    delays = [call.args[0] for call in self.sleep.await_args_list]
+    base = IBClient.CONNECT_BACKOFF_BASE
+    self.assertEqual(len(delays), 2)
+    self.assertTrue(base <= delays[0] < 2 * base)
+    self.assertTrue(2 * base <= delays[1] < 3 * base)
+
+  async def test_gives_up_before_deadline(self) -> None:
+    """No retry is scheduled that would end past CONNECT_DEADLINE."""
+    with (
+      mock.patch.object(IBClient, "CONNECT_DEADLINE", 5.0),
+      self.assertRaises(ConnectionRefusedError),
+    ):
+      await self.client._connect()
+
+    delays = [call.args[0] for call in self.sleep.await_args_list]
+    self.assertLess(sum(delays), 5.0)
+    self.assertLess(
+      self.client.ib.connectAsync.await_count, IBClient.CONNECT_MAX_ATTEMPTS,
+    )
+
+  async def test_waiting_callers_fail_fast(self) -> None:
+    """Callers queued behind a failed attempt do not retry themselves."""
+    results = await asyncio.gather(
+      self.client._connect(), self.client._connect(), return_exceptions=True,
+    )
+    self.assertIsInstance(results[0], ConnectionRefusedError)
+    self.assertIsInstance(results[1], ConnectionError)
+    self.assertNotIsInstance(results[1], ConnectionRefusedError)
+    attempts = self.client.ib.connectAsync.await_count
+    self.assertLessEqual(attempts, IBClient.CONNECT_MAX_ATTEMPTS)
+
+  async def test_client_id_renewed_when_in_use(self) -> None:
+    """Error 326 switches to a new client ID for the next attempt."""
+    client_ids = []
+
+    async def connect(**kwargs: object) -> None:
+      client_ids.append(kwargs["clientId"])
+      if len(client_ids) == 1:
+        self.client.ib.errorEvent.emit(-1, CLIENT_ID_IN_USE, "in use", None)
+        raise ConnectionError
+
+    self.client.ib.connectAsync.side_effect = connect
+    await self.client._connect()
+    self.assertEqual(len(client_ids), 2)
+    self.assertNotEqual(client_ids[0], client_ids[1])
+    self.assertEqual(IBClient._client_id, client_ids[1])
+
+
+class IBCCommandTest(unittest.IsolatedAsyncioTestCase):
+  """IBC command server connection reuse."""
+
+  async def asyncSetUp(self) -> None:
+    """Start a local command server that records connections and commands."""
+    self.connections = 0
+    self.commands: asyncio.Queue[str] = asyncio.Queue()
+    self.close_after_reply = False
+
+    async def handle(
+      reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+    ) -> None:
+      self.connections += 1
+      while line := await reader.readline():
+        self.commands.put_nowait(line.decode().strip())
+        writer.write(b"OK\n")
+        await writer.drain()
+        if self.close_after_reply:
+          break
+      writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    self.addAsyncCleanup(server.wait_closed)
+    self.addCleanup(server.close)
+    port = server.sockets[0].getsockname()[1]
+
+    self.client = IBClient()
+    self.client.config = get_config().model_copy(
+      update={"ib_gateway_host": "127.0.0.1", "ib_command_server_port": port},
+    )
+    self.addAsyncCleanup(self.client.close_ibc_connection)
+
+  async def received(self, count: int) -> list[str]:
+    """Return the next count commands received by the server."""
+    async with asyncio.timeout(1):
+      return [await self.commands.get() for _ in range(count)]
+
+  async def test_commands_reuse_connection(self) -> None:
+    """Consecutive commands are sent on a single connection."""
+    await self.client.send_command_to_ibc("ENABLEAPI")
+    await self.client.send_command_to_ibc("RECONNECTDATA")
+    self.assertEqual(await self.received(2), ["ENABLEAPI", "RECONNECTDATA"])
+    self.assertEqual(self.connections, 1)
+
+  async def test_reconnects_after_server_closes(self) -> None:
+    """A connection closed by IBC is replaced instead of written to."""
+    self.close_after_reply = True
+    await self.client.send_command_to_ibc("RESTART")
+    self.assertEqual(await self.received(1), ["RESTART"])
+    await asyncio.wait_for(IBClient._ibc_reader_task, timeout=1)
+    # Our end is still open, only the reader has seen the EOF
+    self.assertFalse(IBClient._ibc_writer.is_closing())
+
+    await self.client.send_command_to_ibc("ENABLEAPI")
+    self.assertEqual(await self.received(1), ["ENABLEAPI"])
+    self.assertEqual(self.connections, 2)
+
+
+if __name__ == "__main__":
+  unittest.main()
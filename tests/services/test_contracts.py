@@ -0,0 +1,130 @@
+"""Tests for the contract operations."""
+import tempfile
+import unittest
+from unittest import mock
+
+from ib_async import Contract, OptionChain
+
+from app.services.contracts import ContractClient
+from app.util.file_cache import FileCache
+
+
+class FilterCandidatesTest(unittest.TestCase):
+  """Ambiguous contract candidates filtered by listing."""
+
+  def setUp(self) -> None:
+    """Create candidates listed on several exchanges."""
+    self.nasdaq = Contract(
+      conId=1, exchange="SMART", primaryExchange="NASDAQ", currency="USD",
+    )
+    self.island = Contract(
+      conId=2, exchange="ISLAND", primaryExchange="NASDAQ", currency="USD",
+    )
+    self.ibis = Contract(
+      conId=3, exchange="SMART", primaryExchange="IBIS", currency="EUR",
+    )
+    self.candidates = [self.nasdaq, self.island, self.ibis]
+
+  def test_exact_listing(self) -> None:
+    """A fully specified listing matches only that listing."""
+    self.assertEqual(
+      ContractClient._filter_candidates(self.candidates, "SMART", "IBIS", "EUR"),
+      [self.ibis],
+    )
+    self.assertEqual(
+      ContractClient._filter_candidates(self.candidates, "SMART", "IBIS", "USD"),
+      [],
+    )
+
+  def test_none_acts_as_wildcard(self) -> None:
+    """None parameters match any value."""
+    self.assertEqual(
+      ContractClient._filter_candidates(self.candidates, "SMART", None, None),
+      [self.nasdaq, self.ibis],
+    )
+    self.assertEqual(
+      ContractClient._filter_candidates(self.candidates, None, "NASDAQ", "USD"),
+      [self.nasdaq, self.island],
+    )
+    self.assertEqual(
+      ContractClient._filter_candidates(self.candidates, None, None, None),
+      self.candidates,
+    )
+
+  def test_drops_missing_and_duplicate_candidates(self) -> None:
+    """None entries and repeated conIds are skipped."""
+    duplicate = Contract(
+      conId=1, exchange="SMART", primaryExchange="NASDAQ", currency="USD",
+    )
+    self.assertEqual(
+      ContractClient._filter_candidates(
+        [None, self.nasdaq, duplicate, self.island], None, None, None,
+      ),
+      [self.nasdaq, self.island],
+    )
+
+
+class OptionsChainTest(unittest.IsolatedAsyncioTestCase):
+  """get_options_chain against a stubbed IB client."""
+
+  async def asyncSetUp(self) -> None:
+    """Create a client whose IB requests are answered by mocks."""
+    ContractClient.clear_caches()
+    self.client = ContractClient()
+    tmp = tempfile.TemporaryDirectory()
+    self.addCleanup(tmp.cleanup)
+    self.client._option_params_file_cache = FileCache(tmp.name, max_age=60)
+    self.client._connect = mock.AsyncMock()
+
+    chain = OptionChain(
+      exchange="SMART",
+      underlyingConId=265598,
+      tradingClass="AAPL",
+      multiplier="100",
+      expirations=["20250117", "20250221"],
+      strikes=[100.0, 105.0],
+    )
+    self.client.ib = mock.Mock()
+    self.client.ib.reqSecDefOptParamsAsync = mock.AsyncMock(return_value=[chain])
+    # Qualification echoes the requested contracts back
+    self.client.ib.qualifyContractsAsync = mock.AsyncMock(
+      side_effect=lambda *contracts, **_kwargs: list(contracts),
+    )
+
+  async def test_options_ordered_by_right_strike_expiry(self) -> None:
+    """Options are returned by right, then strike, then expiry."""
+    options = await self.client.get_options_chain("AAPL", "STK", 265598)
+    self.assertEqual(
+      [
+        (o["right"], o["strike"], o["last_trade_date_or_contract_month"])
+        for o in options
+      ],
+      [
+        ("C", 100.0, "20250117"),
+        ("C", 100.0, "20250221"),
+        ("C", 105.0, "20250117"),
+        ("C", 105.0, "20250221"),
+        ("P", 100.0, "20250117"),
+        ("P", 100.0, "20250221"),
+        ("P", 105.0, "20250117"),
+        ("P", 105.0, "20250221"),
+      ],
+    )
+
+  async def test_filters_applied(self) -> None:
+    """Only the filtered expirations, strikes and rights are qualified."""
+    options = await self.client.get_options_chain(
+      "AAPL", "STK", 265598,
+      filters={"expirations": ["20250221"], "strikes": [105.0], "rights": ["P"]},
+    )
+    self.assertEqual(
+      [
+        (o["right"], o["strike"], o["last_trade_date_or_contract_month"])
+        for o in options
+      ],
+      [("P", 105.0, "20250221")],
+    )
+
+
+if __name__ == "__main__":
+  unittest.main()
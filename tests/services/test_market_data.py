@@ -0,0 +1,78 @@
+"""Tests for the market data operations."""
+import asyncio
+import unittest
+from unittest import mock
+
+from ib_async import Contract
+
+from app.services.market_data import _QualifyBatcher
+
+# Contract IDs the stubbed IB client cannot qualify
+UNKNOWN_CON_ID = 999
+
+
+def qualify(*contracts: Contract) -> list[Contract | None]:
+  """Qualify contracts like IB, returning None for unknown contract IDs."""
+  return [
+    None if c.conId == UNKNOWN_CON_ID else Contract(conId=c.conId, symbol=f"S{c.conId}")
+    for c in contracts
+  ]
+
+
+class QualifyBatcherTest(unittest.IsolatedAsyncioTestCase):
+  """_QualifyBatcher coalescing of concurrent qualification requests."""
+
+  def setUp(self) -> None:
+    """Create a batcher over a stubbed IB client."""
+    self.ib = mock.Mock()
+    self.ib.qualifyContractsAsync = mock.AsyncMock(side_effect=qualify)
+    self.batcher = _QualifyBatcher(self.ib)
+
+  async def test_concurrent_requests_share_one_call(self) -> None:
+    """Concurrent callers are qualified in a single request without duplicates."""
+    first, second = await asyncio.gather(
+      self.batcher.qualify([1, 2]),
+      self.batcher.qualify([2, 3, UNKNOWN_CON_ID]),
+    )
+    self.assertEqual([c.symbol for c in first], ["S1", "S2"])
+    self.assertEqual([c and c.symbol for c in second], ["S2", "S3", None])
+
+    self.ib.qualifyContractsAsync.assert_awaited_once()
+    requested = self.ib.qualifyContractsAsync.await_args.args
+    self.assertEqual([c.conId for c in requested], [1, 2, 3, UNKNOWN_CON_ID])
+
+  async def test_later_requests_start_a_new_batch(self) -> None:
+    """A request after a batch was flushed is qualified in a new request."""
+    await self.batcher.qualify([1])
+    await self.batcher.qualify([1])
+    self.assertEqual(self.ib.qualifyContractsAsync.await_count, 2)
+
+  async def test_error_raised_to_every_caller(self) -> None:
+    """A failed request fails all callers of the batch."""
+    self.ib.qualifyContractsAsync.side_effect = ConnectionError("lost")
+    results = await asyncio.gather(
+      self.batcher.qualify([1]),
+      self.batcher.qualify([2]),
+      return_exceptions=True,
+    )
+    for result in results:
+      self.assertIsInstance(result, ConnectionError)
+
+  async def test_cancelled_caller_does_not_cancel_others(self) -> None:
+    """Cancelling one caller leaves a shared contract ID to the others."""
+    cancelled = asyncio.create_task(self.batcher.qualify([1]))
+    other = asyncio.create_task(self.batcher.qualify([1]))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    self.assertEqual([c.symbol for c in await other], ["S1"])
+    with self.assertRaises(asyncio.CancelledError):
+      await cancelled
+
+  async def test_empty_request(self) -> None:
+    """An empty request returns no contracts."""
+    self.assertEqual(await self.batcher.qualify([]), [])
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,121 @@
+"""Tests for the scanner operations."""
+import unittest
+from unittest import mock
+
+from defusedxml import ElementTree
+
+from app.services.scanners import (
+  ScannerClient,
+  _extract_scanner_codes,
+  _tags_to_tagvalues,
+)
+
+# Trimmed scanner parameters XML in the layout IB returns, with nested
+# locations and a decoy <type> outside any <Instrument>
+SCANNER_PARAMETERS = """<?xml version="1.0" encoding="UTF-8"?>
+<ScanParameterResponse>
+  <InstrumentList>
+    <Instrument><name>US Stocks</name><type>STK</type></Instrument>
+    <Instrument><name>US Futures</name><type>FUT.US</type></Instrument>
+  </InstrumentList>
+  <LocationTree>
+    <Location>
+      <displayName>US Stocks</displayName>
+      <locationCode>STK.US</locationCode>
+      <LocationTree>
+        <Location>
+          <displayName>NASDAQ</displayName>
+          <locationCode>STK.NASDAQ</locationCode>
+        </Location>
+      </LocationTree>
+    </Location>
+  </LocationTree>
+  <FilterList>
+    <RangeFilter>
+      <AbstractField><code>priceAbove</code><type>DOUBLE</type></AbstractField>
+      <AbstractField><code>priceBelow</code></AbstractField>
+    </RangeFilter>
+  </FilterList>
+  <ScanTypeList>
+    <ScanType><scanCode>TOP_PERC_GAIN</scanCode></ScanType>
+    <ScanType><scanCode>HOT_BY_VOLUME</scanCode></ScanType>
+  </ScanTypeList>
+</ScanParameterResponse>
+"""
+
+
+class ExtractScannerCodesTest(unittest.TestCase):
+  """Streaming extraction of scanner codes."""
+
+  def test_extracts_codes(self) -> None:
+    """Codes are collected per kind in document order."""
+    self.assertEqual(
+      _extract_scanner_codes(SCANNER_PARAMETERS),
+      {
+        "instrument": ["STK", "FUT.US"],
+        "location": ["STK.US", "STK.NASDAQ"],
+        "filter": ["priceAbove", "priceBelow"],
+        "scan": ["TOP_PERC_GAIN", "HOT_BY_VOLUME"],
+      },
+    )
+
+  def test_matches_tree_queries(self) -> None:
+    """Streaming yields the same codes as querying the full tree."""
+    tree = ElementTree.fromstring(SCANNER_PARAMETERS.encode())
+    codes = _extract_scanner_codes(SCANNER_PARAMETERS)
+    for key, path in (
+      ("instrument", ".//Instrument/type"),
+      ("location", ".//Location/locationCode"),
+      ("filter", ".//AbstractField/code"),
+      ("scan", ".//scanCode"),
+    ):
+      with self.subTest(key=key):
+        self.assertEqual(codes[key], [e.text for e in tree.findall(path)])
+
+
+class TagsToTagValuesTest(unittest.TestCase):
+  """Conversion of filter codes to TagValues."""
+
+  def test_splits_on_first_equals_sign(self) -> None:
+    """Values may contain '='."""
+    tag_values = _tags_to_tagvalues(("priceAbove=5", "expr=a=b"))
+    self.assertEqual(
+      [(t.tag, t.value) for t in tag_values],
+      [("priceAbove", "5"), ("expr", "a=b")],
+    )
+
+
+class ScannerCodesCacheTest(unittest.IsolatedAsyncioTestCase):
+  """Scanner parameters are fetched once and shared."""
+
+  async def asyncSetUp(self) -> None:
+    """Create a client whose scanner parameters come from a mock."""
+    ScannerClient._scanner_codes_cache.clear()
+    self.addCleanup(ScannerClient._scanner_codes_cache.clear)
+    self.client = ScannerClient()
+    self.client._connect = mock.AsyncMock()
+    self.client.ib = mock.Mock()
+    self.client.ib.reqScannerParametersAsync = mock.AsyncMock(
+      return_value=SCANNER_PARAMETERS,
+    )
+
+  async def test_parameters_fetched_once(self) -> None:
+    """All code lists are served from a single parameters request."""
+    self.assertEqual(
+      await self.client.get_scanner_instrument_codes(), ["STK", "FUT.US"],
+    )
+    self.assertEqual(
+      await self.client.get_scanner_scan_codes(), ["TOP_PERC_GAIN", "HOT_BY_VOLUME"],
+    )
+    self.client.ib.reqScannerParametersAsync.assert_awaited_once()
+
+  async def test_returned_lists_are_copies(self) -> None:
+    """Changing a returned list does not change the cached codes."""
+    (await self.client.get_scanner_location_codes()).clear()
+    self.assertEqual(
+      await self.client.get_scanner_location_codes(), ["STK.US", "STK.NASDAQ"],
+    )
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,85 @@
+"""Tests for the async batching utility functions."""
+import asyncio
+import unittest
+
+from app.util.batching import gather_in_chunks
+
+
+class GatherInChunksTest(unittest.IsolatedAsyncioTestCase):
+  """gather_in_chunks chunking, ordering and limits."""
+
+  async def test_chunks_items_and_preserves_order(self) -> None:
+    """Items are split into chunks and results keep the input order."""
+    calls = []
+
+    async def double(*items: int) -> list[int]:
+      calls.append(items)
+      # Finish later chunks first so order cannot come from completion time
+      await asyncio.sleep(0.01 * (10 - items[0]))
+      return [item * 2 for item in items]
+
+    results = await gather_in_chunks(
+      double, list(range(7)), chunk_size=3, max_concurrency=4,
+    )
+    self.assertEqual(results, [0, 2, 4, 6, 8, 10, 12])
+    self.assertEqual(sorted(calls), [(0, 1, 2), (3, 4, 5), (6,)])
+
+  async def test_empty_items(self) -> None:
+    """No items results in no calls."""
+    async def fail(*_items: int) -> list[int]:
+      self.fail("func must not be called")
+
+    self.assertEqual(
+      await gather_in_chunks(fail, [], chunk_size=3, max_concurrency=1), [],
+    )
+
+  async def test_limits_concurrency(self) -> None:
+    """No more than max_concurrency calls are in flight at once."""
+    in_flight = 0
+    peak = 0
+
+    async def track(*items: int) -> list[int]:
+      nonlocal in_flight, peak
+      in_flight += 1
+      peak = max(peak, in_flight)
+      await asyncio.sleep(0.01)
+      in_flight -= 1
+      return list(items)
+
+    results = await gather_in_chunks(
+      track, list(range(10)), chunk_size=1, max_concurrency=3,
+    )
+    self.assertEqual(results, list(range(10)))
+    self.assertEqual(peak, 3)
+
+  async def test_timeout_per_call(self) -> None:
+    """A call exceeding the timeout raises TimeoutError."""
+    async def slow(*items: int) -> list[int]:
+      await asyncio.sleep(1)
+      return list(items)
+
+    with self.assertRaises(TimeoutError):
+      await gather_in_chunks(
+        slow, [1], chunk_size=1, max_concurrency=1, timeout=0.01,
+      )
+
+  async def test_key_shards_chunks(self) -> None:
+    """With a key, a chunk never mixes items from different shards."""
+    calls = []
+
+    async def echo(*items: str) -> list[str]:
+      calls.append(items)
+      return list(items)
+
+    items = ["a1", "b1", "a2", "b2", "a3", "c1"]
+    results = await gather_in_chunks(
+      echo, items, chunk_size=2, max_concurrency=2, key=lambda item: item[0],
+    )
+    self.assertEqual(results, ["a1", "a2", "a3", "b1", "b2", "c1"])
+    self.assertEqual(
+      sorted(calls), [("a1", "a2"), ("a3",), ("b1", "b2"), ("c1",)],
+    )
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,68 @@
+"""Tests for the on-disk pickle cache utility."""
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from app.util.file_cache import FileCache
+
+
+class FileCacheTest(unittest.IsolatedAsyncioTestCase):
+  """FileCache persistence and eviction."""
+
+  def setUp(self) -> None:
+    """Create a temporary cache directory."""
+    tmp = tempfile.TemporaryDirectory()
+    self.addCleanup(tmp.cleanup)
+    self.directory = Path(tmp.name) / "cache"
+
+  async def test_round_trip(self) -> None:
+    """A stored value is read back equal."""
+    cache = FileCache(self.directory, max_age=60)
+    value = {"strikes": [100.0, 105.0], "expirations": ["20250117"]}
+    await cache.set("chain", value)
+    self.assertEqual(await cache.get("chain"), value)
+
+  async def test_value_shared_between_instances(self) -> None:
+    """A value written by one instance is visible to another."""
+    await FileCache(self.directory, max_age=60).set("chain", [1, 2])
+    self.assertEqual(await FileCache(self.directory, max_age=60).get("chain"), [1, 2])
+
+  async def test_missing_key_returns_none(self) -> None:
+    """A key that was never stored returns None."""
+    cache = FileCache(self.directory, max_age=60)
+    self.assertIsNone(await cache.get("missing"))
+
+  async def test_corrupt_file_returns_none(self) -> None:
+    """An unreadable cache file is treated as a miss."""
+    self.directory.mkdir(parents=True)
+    (self.directory / "chain.pkl").write_bytes(b"not a pickle")
+    cache = FileCache(self.directory, max_age=60)
+    self.assertIsNone(await cache.get("chain"))
+
+  async def test_set_replaces_value_without_leftovers(self) -> None:
+    """Overwriting a key leaves a single cache file and no temporary files."""
+    cache = FileCache(self.directory, max_age=60)
+    await cache.set("chain", 1)
+    await cache.set("chain", 2)
+    self.assertEqual(await cache.get("chain"), 2)
+    self.assertEqual(
+      sorted(p.name for p in self.directory.iterdir()), ["chain.pkl"],
+    )
+
+  async def test_expired_files_evicted_on_first_access(self) -> None:
+    """Files older than max_age are removed when the cache is first used."""
+    await FileCache(self.directory, max_age=60).set("old", 1)
+    await FileCache(self.directory, max_age=60).set("new", 2)
+    stale = time.time() - 120
+    os.utime(self.directory / "old.pkl", (stale, stale))
+
+    cache = FileCache(self.directory, max_age=60)
+    self.assertIsNone(await cache.get("old"))
+    self.assertEqual(await cache.get("new"), 2)
+    self.assertFalse((self.directory / "old.pkl").exists())
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,52 @@
+"""Tests for the numeric sanitizing utility functions."""
+import doctest
+import math
+import unittest
+
+from app.util import numbers
+from app.util.numbers import valid_value
+
+
+class ValidValueTest(unittest.TestCase):
+  """valid_value conversion and sentinel handling."""
+
+  def test_converts_valid_values(self) -> None:
+    """Valid values are converted to the requested type."""
+    self.assertEqual(valid_value(1.5), 1.5)
+    self.assertEqual(valid_value("2.25"), 2.25)
+    self.assertEqual(valid_value(0), 0.0)
+    self.assertIsInstance(valid_value(3), float)
+    self.assertEqual(valid_value(100.0, int), 100)
+    self.assertIsInstance(valid_value(100.0, int), int)
+
+  def test_missing_and_sentinel_values(self) -> None:
+    """None, NaN, infinities and -1 are dropped."""
+    for value in (None, math.nan, math.inf, -math.inf, -1, -1.0):
+      with self.subTest(value=value):
+        self.assertIsNone(valid_value(value))
+    self.assertIsNone(valid_value(-1, int))
+
+  def test_negative_values_other_than_sentinel(self) -> None:
+    """Only -1 is a sentinel, other negative values are kept."""
+    self.assertEqual(valid_value(-0.5), -0.5)
+    self.assertEqual(valid_value(-2, int), -2)
+
+  def test_unconvertible_values(self) -> None:
+    """Values that cannot be converted are dropped."""
+    for value, value_type in (
+      ("abc", float),
+      (object(), float),
+      ("1.5", int),
+      (math.nan, int),
+      (math.inf, int),
+    ):
+      with self.subTest(value=value, value_type=value_type):
+        self.assertIsNone(valid_value(value, value_type))
+
+  def test_docstring_examples(self) -> None:
+    """The docstring examples hold."""
+    self.assertEqual(doctest.testmod(numbers).failed, 0)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,90 @@
+"""Tests for the time-to-live cache utility."""
+import unittest
+from unittest import mock
+
+from app.util.ttl_cache import TTLCache
+
+
+class TTLCacheTest(unittest.TestCase):
+  """TTLCache expiry and eviction."""
+
+  def setUp(self) -> None:
+    """Freeze the monotonic clock, advanced manually by the tests."""
+    self.now = 1000.0
+    patcher = mock.patch(
+      "app.util.ttl_cache.time.monotonic", side_effect=lambda: self.now,
+    )
+    patcher.start()
+    self.addCleanup(patcher.stop)
+
+  def test_get_returns_stored_value(self) -> None:
+    """A stored value is returned until it expires."""
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    self.assertEqual(cache.get("a"), 1)
+
+  def test_get_missing_returns_default(self) -> None:
+    """A missing key returns the default."""
+    cache = TTLCache(maxsize=2, ttl=10)
+    self.assertIsNone(cache.get("a"))
+    self.assertEqual(cache.get("a", "fallback"), "fallback")
+
+  def test_entry_expires_after_ttl(self) -> None:
+    """An entry is dropped once its ttl has elapsed."""
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    self.now += 9.9
+    self.assertEqual(cache.get("a"), 1)
+    self.now += 0.1
+    self.assertIsNone(cache.get("a"))
+    self.assertEqual(len(cache), 0)
+
+  def test_set_ttl_overrides_default(self) -> None:
+    """A ttl passed to set replaces the default for that entry."""
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("short", 1, ttl=1)
+    cache.set("long", 2, ttl=100)
+    self.now += 50
+    self.assertIsNone(cache.get("short"))
+    self.assertEqual(cache.get("long"), 2)
+
+  def test_set_refreshes_expiry(self) -> None:
+    """Overwriting a key restarts its ttl."""
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    self.now += 8
+    cache.set("a", 2)
+    self.now += 8
+    self.assertEqual(cache.get("a"), 2)
+
+  def test_evicts_least_recently_used(self) -> None:
+    """Exceeding maxsize evicts the least recently used entry."""
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    self.assertEqual(len(cache), 2)
+    self.assertIsNone(cache.get("b"))
+    self.assertEqual(cache.get("a"), 1)
+    self.assertEqual(cache.get("c"), 3)
+
+  def test_clear_removes_all_entries(self) -> None:
+    """Clear empties the cache."""
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.clear()
+    self.assertEqual(len(cache), 0)
+    self.assertIsNone(cache.get("a"))
+
+  def test_len_counts_expired_entries(self) -> None:
+    """Expired entries are only dropped when they are looked up."""
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    self.now += 20
+    self.assertEqual(len(cache), 1)
+
+
+if __name__ == "__main__":
+  unittest.main()